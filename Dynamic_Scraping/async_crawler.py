@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit, urldefrag
+
+from fetch_engine import FetchEngine
+from static_extractor import extract_static_content
+
+
+class AsyncCrawler:
+    """
+    Asyncio crawler for static pages
+    URLs go through a frontier queue and are fetched concurrently,
+    bounded globally (max_concurrency) and per host (per_host_limit).
+    Fetch + extraction run on a thread pool over the pooled FetchEngine,
+    so the blocking requests/BeautifulSoup code is reused as-is.
+    A URL whose host is already at per_host_limit is parked in that host's
+    queue instead of holding a worker, so one slow host can't stall the rest.
+    """
+
+    def __init__(self, engine=None, max_concurrency=64, per_host_limit=8,
+                 extract=extract_static_content, follow_links=False,
+                 same_host_only=True, max_pages=None, archive=None, replay=None):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.extract = extract
+        self.follow_links = follow_links
+        self.same_host_only = same_host_only
+        self.max_pages = max_pages
+        self.logger = logging.getLogger(__name__)
+
+        # Keep enough keep-alive connections per host for per_host_limit workers
+        self.owns_engine = engine is None
+        self.engine = engine or FetchEngine(
+            pool_connections=max(20, max_concurrency),
+            pool_maxsize=per_host_limit,
+            archive=archive,
+            replay=replay
+        )
+
+    def run(self, seed_urls):
+        """Crawl seed_urls and return one result dict per fetched URL"""
+        return asyncio.run(self.crawl(seed_urls))
+
+    async def crawl(self, seed_urls):
+        """
+        Crawl all seed URLs (and discovered links when follow_links is set)
+        Each result is {'url', 'data', 'error', 'elapsed'}
+        """
+        start_time = time.time()
+        frontier = asyncio.Queue()
+        seen = set()
+        results = []
+        host_active = {}   # host -> fetches in flight
+        host_waiting = {}  # host -> URLs parked until a slot frees up
+
+        seed_hosts = {urlsplit(url).netloc for url in seed_urls}
+
+        def enqueue(url):
+            url = urldefrag(url)[0]
+            if url in seen:
+                return
+            if self.max_pages is not None and len(seen) >= self.max_pages:
+                return
+            seen.add(url)
+            frontier.put_nowait(url)
+
+        for url in seed_urls:
+            enqueue(url)
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+
+        def follow_links(url, result):
+            for link in result['data'].get('links', []):
+                try:
+                    next_url = urljoin(url, link['url'])
+                    if not next_url.startswith(('http://', 'https://')):
+                        continue
+                    if self.same_host_only and urlsplit(next_url).netloc not in seed_hosts:
+                        continue
+                    enqueue(next_url)
+                except ValueError as e:
+                    # Malformed hrefs (e.g. 'http://[bad/') - skip the link, not the page
+                    self.logger.debug(f"Skipping bad link {link.get('url')!r} on {url}: {e}")
+
+        async def crawl_one(url):
+            host = urlsplit(url).netloc
+
+            # No await between the check and the increment, so this is race-free
+            if host_active.get(host, 0) >= self.per_host_limit:
+                host_waiting.setdefault(host, deque()).append(url)
+                return
+
+            host_active[host] = host_active.get(host, 0) + 1
+            try:
+                result = await loop.run_in_executor(executor, self.fetch_and_extract, url)
+                results.append(result)
+
+                if self.follow_links and result['data']:
+                    try:
+                        follow_links(url, result)
+                    except Exception as e:
+                        # The page itself was crawled fine - keep its result
+                        self.logger.warning(f"Could not follow links of {url}: {e}")
+            finally:
+                host_active[host] -= 1
+                # Hand the freed slot to the next parked URL of this host
+                # (re-queued before task_done, so join() can't finish early)
+                if host_waiting.get(host):
+                    frontier.put_nowait(host_waiting[host].popleft())
+
+        async def worker():
+            while True:
+                url = await frontier.get()
+                try:
+                    await crawl_one(url)
+                except Exception as e:
+                    # A dead worker would leave join() waiting forever - record the failure and go on
+                    self.logger.warning(f"Failed to crawl {url}: {e}")
+                    results.append({'url': url, 'data': {}, 'error': str(e), 'elapsed': 0.0})
+                finally:
+                    frontier.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+
+        try:
+            await frontier.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            executor.shutdown(wait=False)
+
+        elapsed = time.time() - start_time
+        failed = sum(1 for result in results if result['error'])
+        self.logger.info(
+            f"Crawled {len(results)} URLs in {elapsed:.2f}s "
+            f"({len(results) / elapsed if elapsed else 0:.1f} pages/s, {failed} failed)"
+        )
+
+        return results
+
+    def close(self):
+        """Close the FetchEngine if this crawler created it"""
+        if self.owns_engine:
+            self.engine.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def fetch_and_extract(self, url):
+        """Fetch one URL and run the extraction function on it (runs on a worker thread)"""
+        start_time = time.time()
+
+        try:
+            response = self.engine.fetch(url)
+            data = self.extract(response.content)
+            error = None
+        except Exception as e:
+            self.logger.warning(f"Failed to crawl {url}: {e}")
+            data = {}
+            error = str(e)
+
+        return {
+            'url': url,
+            'data': data,
+            'error': error,
+            'elapsed': time.time() - start_time
+        }
@@ -0,0 +1,132 @@
+import os
+import sqlite3
+import threading
+import logging
+from contextlib import contextmanager
+
+# Pragmas applied to every connection the manager opens
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',     # readers don't block the writer and vice versa
+    'synchronous': 'NORMAL',   # safe with WAL, far fewer fsyncs than FULL
+    'cache_size': -64000,      # negative = KiB, so ~64 MB page cache
+    'temp_store': 'MEMORY',
+    'busy_timeout': 30000      # ms to wait for a lock instead of failing with "database is locked"
+}
+
+
+class ConnectionManager:
+    """
+    Persistent SQLite connections shared by everything that uses one database file
+    Each thread gets its own long-lived connection (sqlite3 connections must not
+    cross threads), opened once with WAL journaling and tuned pragmas.
+    Writes go through write(), which serialises writers inside this process.
+    Connections run in autocommit mode (isolation_level=None): a statement
+    outside write() commits on its own instead of leaving an implicit
+    transaction open for the next write() to stumble into.
+    """
+
+    def __init__(self, db_name='scraping_data.db', pragmas=None):
+        self.db_name = db_name
+        self.pragmas = dict(DEFAULT_PRAGMAS, **(pragmas or {}))
+        self.logger = logging.getLogger(__name__)
+
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+    def connection(self):
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # check_same_thread=False only so close() can shut down every thread's connection
+            conn = sqlite3.connect(
+                self.db_name,
+                timeout=self.pragmas['busy_timeout'] / 1000,
+                isolation_level=None,
+                check_same_thread=False
+            )
+            for name, value in self.pragmas.items():
+                conn.execute(f'PRAGMA {name}={value}')
+
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+            self.logger.debug(f"Opened connection to {self.db_name} in {threading.current_thread().name}")
+
+        return conn
+
+    @contextmanager
+    def write(self):
+        """
+        Run a block of writes as one transaction on this thread's connection
+        Commits on success, rolls back on error
+        """
+        with self._write_lock:
+            conn = self.connection()
+
+            # Nested write() blocks join the outer transaction - tracked with
+            # our own depth counter, not conn.in_transaction
+            if self._local.depth:
+                self._local.depth += 1
+                try:
+                    yield conn
+                finally:
+                    self._local.depth -= 1
+                return
+
+            conn.execute('BEGIN IMMEDIATE')
+            self._local.depth = 1
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._local.depth = 0
+
+    def release(self):
+        """Close this thread's connection (call it before a worker thread exits)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+
+        self._local.conn = None
+        with self._connections_lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        try:
+            conn.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing connection: {e}")
+        self.logger.debug(f"Released connection to {self.db_name} in {threading.current_thread().name}")
+
+    def close(self):
+        """
+        Close every connection opened by this manager, in all threads
+        Only for process shutdown - a single consumer should use release()
+        """
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception as e:
+                    self.logger.warning(f"Error closing connection: {e}")
+            self._connections = []
+
+        self._local = threading.local()
+
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+def get_connection_manager(db_name='scraping_data.db'):
+    """Return the process-wide ConnectionManager for db_name (one per database file)"""
+    key = os.path.abspath(db_name)
+    with _managers_lock:
+        if key not in _managers:
+            _managers[key] = ConnectionManager(db_name)
+        return _managers[key]
@@ -1,17 +1,58 @@
-import sqlite3
 import pandas as pd
 import json
 from datetime import datetime
+from itertools import islice
 import logging
 
+from connection_manager import get_connection_manager
+from table_exporter import export_table, EXPORT_FORMATS
+from scraping_stats import ScrapingStats, install_stat_triggers
+from schema_migrations import apply_migrations, add_unique_key
+
+# Secondary indexes added by migrate_schema(): (index name, table, column)
+SCHEMA_INDEXES = [
+    ('idx_quotes_author', 'quotes', 'author'),
+    ('idx_quotes_source_url', 'quotes', 'source_url'),
+    ('idx_quotes_scrape_timestamp', 'quotes', 'scrape_timestamp'),
+    ('idx_products_source_url', 'products', 'source_url'),
+    ('idx_products_scrape_timestamp', 'products', 'scrape_timestamp'),
+    ('idx_general_content_content_type', 'general_content', 'content_type'),
+    ('idx_general_content_source_url', 'general_content', 'source_url'),
+    ('idx_general_content_scrape_timestamp', 'general_content', 'scrape_timestamp'),
+    ('idx_scraping_sessions_start_time', 'scraping_sessions', 'start_time')
+]
+
+# Natural keys enforced with UNIQUE indexes: (index name, table, columns)
+# save_quotes/save_products upsert on these instead of inserting duplicates
+NATURAL_KEYS = [
+    ('ux_quotes_natural_key', 'quotes', ('quote_text', 'author')),
+    ('ux_products_natural_key', 'products', ('product_name', 'source_url'))
+]
+
+# Columns the query API may filter on with equality, per table (all are indexed)
+QUERY_FILTERS = {
+    'quotes': ('author', 'source_url'),
+    'products': ('source_url',),
+    'general_content': ('content_type', 'source_url')
+}
+
 class ScrapingDatabase:
     """
     Database manager for storing scraped data
     This replaces CSV files with a proper database
     """
     
-    def __init__(self, db_name='scraping_data.db'):
+    def __init__(self, db_name='scraping_data.db', batch_size=5000, stats_ttl=30, dedup_store=None):
         self.db_name = db_name
+        self.batch_size = batch_size  # rows per executemany call
+        # Optional persistent DedupStore for the append-only general_content table:
+        # content stored in earlier runs is skipped. quotes/products upsert on their
+        # natural keys instead, so re-scraped rows are refreshed rather than dropped
+        self.dedup_store = dedup_store
+        # One persistent WAL connection per thread, shared with the pipeline
+        self.connections = get_connection_manager(db_name)
+        # Cached summary over trigger-maintained counters
+        self.stats = ScrapingStats(self.connections, ttl=stats_ttl)
         self.setup_logging()  # FIXED: Setup logging FIRST
         self.setup_database() # Then setup database
     
@@ -34,83 +75,111 @@ class ScrapingDatabase:
         This is where we define our data structure
         """
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            # Table for quotes data
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS quotes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    quote_text TEXT NOT NULL,
-                    author TEXT NOT NULL,
-                    tags TEXT,
-                    page_number INTEGER,
-                    source_url TEXT,
-                    scrape_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    data_quality_score INTEGER DEFAULT 100
-                )
-            ''')
-            
-            # Table for product data
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS products (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    product_name TEXT NOT NULL,
-                    price TEXT,
-                    description TEXT,
-                    category TEXT,
-                    source_url TEXT,
-                    scrape_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    is_available BOOLEAN DEFAULT TRUE
-                )
-            ''')
-            
-            # Table for general content (paragraphs, headings, etc.)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS general_content (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    content_type TEXT NOT NULL,
-                    content_text TEXT NOT NULL,
-                    source_url TEXT,
-                    content_length INTEGER,
-                    word_count INTEGER,
-                    scrape_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Table for tracking scraping sessions
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS scraping_sessions (
-                    session_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    start_time DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    end_time DATETIME,
-                    total_records INTEGER,
-                    status TEXT DEFAULT 'running',
-                    websites_scraped TEXT
-                )
-            ''')
-            
-            conn.commit()
-            conn.close()
+            with self.connections.write() as conn:
+                self.migrate_schema(conn.cursor())
             self.logger.info("Database tables created successfully!")
             
         except Exception as e:
             self.logger.error(f"Error setting up database: {e}")
     
+    def create_tables(self, cursor):
+        """Create all tables (no-op for tables that already exist)"""
+        # Table for quotes data
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS quotes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                quote_text TEXT NOT NULL,
+                author TEXT NOT NULL,
+                tags TEXT,
+                page_number INTEGER,
+                source_url TEXT,
+                scrape_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                data_quality_score INTEGER DEFAULT 100
+            )
+        ''')
+        
+        # Table for product data
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS products (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                product_name TEXT NOT NULL,
+                price TEXT,
+                description TEXT,
+                category TEXT,
+                source_url TEXT,
+                scrape_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                is_available BOOLEAN DEFAULT TRUE
+            )
+        ''')
+        
+        # Table for general content (paragraphs, headings, etc.)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS general_content (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                content_type TEXT NOT NULL,
+                content_text TEXT NOT NULL,
+                source_url TEXT,
+                content_length INTEGER,
+                word_count INTEGER,
+                scrape_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Table for tracking scraping sessions
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scraping_sessions (
+                session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                start_time DATETIME DEFAULT CURRENT_TIMESTAMP,
+                end_time DATETIME,
+                total_records INTEGER,
+                status TEXT DEFAULT 'running',
+                websites_scraped TEXT
+            )
+        ''')
+    
+    def migrations(self):
+        """
+        Versioned schema steps for this database, oldest first
+        Append new steps with the next version number - never edit applied ones
+        """
+        return [
+            (1, 'core tables', self.create_tables),
+            (2, 'secondary indexes for the query API', self.create_indexes),
+            (3, 'trigger-maintained stat counters', install_stat_triggers),
+            (4, 'UNIQUE natural keys for upserts', self.add_natural_keys)
+        ]
+    
+    def migrate_schema(self, cursor):
+        """
+        Bring a new or existing database up to the current schema
+        Only steps newer than the recorded schema_version run; existing data is kept
+        """
+        apply_migrations(cursor, 'scraping_database', self.migrations(), self.logger)
+    
+    def create_indexes(self, cursor):
+        """Secondary indexes used by the query API"""
+        for index_name, table_name, column in SCHEMA_INDEXES:
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({column})')
+    
+    def add_natural_keys(self, cursor):
+        """UNIQUE natural-key indexes; duplicates left by earlier runs are collapsed to the newest row"""
+        for index_name, table_name, columns in NATURAL_KEYS:
+            removed = add_unique_key(cursor, index_name, table_name, columns)
+            if removed:
+                self.logger.info(f"Removed {removed} duplicate rows from {table_name}")
+    
     def start_scraping_session(self):
         """Start a new scraping session and return session ID"""
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO scraping_sessions (start_time, status) 
-                VALUES (datetime('now'), 'running')
-            ''')
-            
-            session_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            with self.connections.write() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    INSERT INTO scraping_sessions (start_time, status) 
+                    VALUES (datetime('now'), 'running')
+                ''')
+                
+                session_id = cursor.lastrowid
             
             self.logger.info(f"Started scraping session ID: {session_id}")
             return session_id
@@ -122,117 +191,156 @@ class ScrapingDatabase:
     def end_scraping_session(self, session_id, total_records, websites):
         """Mark a scraping session as completed"""
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE scraping_sessions 
-                SET end_time = datetime('now'), 
-                    total_records = ?,
-                    status = 'completed',
-                    websites_scraped = ?
-                WHERE session_id = ?
-            ''', (total_records, websites, session_id))
-            
-            conn.commit()
-            conn.close()
+            with self.connections.write() as conn:
+                conn.execute('''
+                    UPDATE scraping_sessions 
+                    SET end_time = datetime('now'), 
+                        total_records = ?,
+                        status = 'completed',
+                        websites_scraped = ?
+                    WHERE session_id = ?
+                ''', (total_records, websites, session_id))
             
             self.logger.info(f"Completed scraping session ID: {session_id}")
             
         except Exception as e:
             self.logger.error(f"Error ending session: {e}")
     
+    def bulk_insert(self, sql, rows):
+        """
+        Insert rows (an iterable of parameter tuples) with executemany,
+        batch_size rows at a time, all inside one explicit transaction
+        Returns the number of rows written (inserted or, for upserts, updated)
+        """
+        with self.connections.write() as conn:
+            cursor = conn.cursor()
+            
+            inserted = 0
+            rows = iter(rows)
+            while True:
+                chunk = list(islice(rows, self.batch_size))
+                if not chunk:
+                    break
+                cursor.executemany(sql, chunk)
+                inserted += len(chunk)
+        
+        return inserted
+    
     def save_quotes(self, quotes_data):
         """
         Save quotes data to database
         quotes_data should be a list of dictionaries
+        A quote already stored (same text and author) is refreshed, not duplicated
+        Returns the number of rows inserted or updated
         """
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            for quote in quotes_data:
-                # Calculate data quality score
-                quality_score = self.calculate_quality_score(quote)
-                
-                cursor.execute('''
-                    INSERT INTO quotes 
-                    (quote_text, author, tags, page_number, source_url, data_quality_score)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
+            rows = (
+                (
                     quote.get('text', ''),
                     quote.get('author', 'Unknown'),
                     quote.get('tags', ''),
                     quote.get('page', 1),
                     quote.get('source_url', ''),
-                    quality_score
-                ))
-            
-            conn.commit()
-            conn.close()
-            
-            self.logger.info(f"Saved {len(quotes_data)} quotes to database")
+                    self.calculate_quality_score(quote)
+                )
+                for quote in quotes_data
+            )
+            
+            written = self.bulk_insert('''
+                INSERT INTO quotes 
+                (quote_text, author, tags, page_number, source_url, data_quality_score)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(quote_text, author) DO UPDATE SET
+                    tags = excluded.tags,
+                    page_number = excluded.page_number,
+                    source_url = excluded.source_url,
+                    data_quality_score = excluded.data_quality_score,
+                    scrape_timestamp = CURRENT_TIMESTAMP
+            ''', rows)
+            
+            self.logger.info(f"Saved {written} quotes to database (new or refreshed)")
+            return written
             
         except Exception as e:
             self.logger.error(f"Error saving quotes: {e}")
+            return 0
     
     def save_products(self, products_data):
         """
         Save products data to database
+        A product already stored (same name and source URL) gets its price and timestamp refreshed
+        Returns the number of rows inserted or updated
         """
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            for product in products_data:
-                cursor.execute('''
-                    INSERT INTO products 
-                    (product_name, price, description, category, source_url)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
+            rows = (
+                (
                     product.get('name', 'Unknown Product'),
                     product.get('price', 'N/A'),
                     product.get('description', ''),
                     product.get('category', 'General'),
                     product.get('source_url', '')
-                ))
-            
-            conn.commit()
-            conn.close()
-            
-            self.logger.info(f"Saved {len(products_data)} products to database")
+                )
+                for product in products_data
+            )
+            
+            written = self.bulk_insert('''
+                INSERT INTO products 
+                (product_name, price, description, category, source_url)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(product_name, source_url) DO UPDATE SET
+                    price = excluded.price,
+                    description = excluded.description,
+                    category = excluded.category,
+                    is_available = TRUE,
+                    scrape_timestamp = CURRENT_TIMESTAMP
+            ''', rows)
+            
+            self.logger.info(f"Saved {written} products to database (new or refreshed)")
+            return written
             
         except Exception as e:
             self.logger.error(f"Error saving products: {e}")
+            return 0
     
     def save_general_content(self, content_data):
         """
         Save general content to database
+        Returns the number of rows inserted
         """
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
+            if self.dedup_store is not None:
+                content_data = self.dedup_store.filter_unseen(content_data, text_key='content', namespace='general_content')
             
-            for content in content_data:
-                cursor.execute('''
-                    INSERT INTO general_content 
-                    (content_type, content_text, source_url, content_length, word_count)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
+            def to_row(content):
+                text = content.get('content', '')
+                return (
                     content.get('type', 'unknown'),
-                    content.get('content', ''),
+                    text,
                     content.get('source_url', ''),
-                    len(content.get('content', '')),
-                    len(content.get('content', '').split())
-                ))
+                    len(text),
+                    len(text.split())
+                )
             
-            conn.commit()
-            conn.close()
+            inserted = self.bulk_insert('''
+                INSERT INTO general_content 
+                (content_type, content_text, source_url, content_length, word_count)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (to_row(content) for content in content_data))
             
-            self.logger.info(f"Saved {len(content_data)} content items to database")
+            # Only now that the rows are committed - a failed insert must stay retryable
+            if self.dedup_store is not None:
+                self.dedup_store.record_seen(content_data, text_key='content', namespace='general_content')
+            
+            self.logger.info(f"Saved {inserted} content items to database")
+            return inserted
             
         except Exception as e:
             self.logger.error(f"Error saving content: {e}")
+            return 0
+    
+    def close(self):
+        """Release this thread's database connection (the manager is shared with other users)"""
+        self.connections.release()
     
     def calculate_quality_score(self, data):
         """
@@ -255,38 +363,100 @@ class ScrapingDatabase:
         
         return max(0, score)  # Ensure score doesn't go below 0
     
-    def get_scraping_stats(self):
-        """Get statistics about scraped data"""
+    def get_scraping_stats(self, force_refresh=False):
+        """
+        Get statistics about scraped data
+        Served from running counters and cached for stats_ttl seconds
+        """
         try:
-            conn = sqlite3.connect(self.db_name)
+            summary = self.stats.summary(force_refresh=force_refresh)
+            session_columns, session_rows = summary['recent_sessions']
             
             stats = {
-                'total_quotes': pd.read_sql('SELECT COUNT(*) as count FROM quotes', conn).iloc[0]['count'],
-                'total_products': pd.read_sql('SELECT COUNT(*) as count FROM products', conn).iloc[0]['count'],
-                'total_content': pd.read_sql('SELECT COUNT(*) as count FROM general_content', conn).iloc[0]['count'],
-                'top_authors': pd.read_sql('SELECT author, COUNT(*) as count FROM quotes GROUP BY author ORDER BY count DESC LIMIT 5', conn),
-                'recent_sessions': pd.read_sql('SELECT * FROM scraping_sessions ORDER BY start_time DESC LIMIT 3', conn)
+                'total_quotes': summary['total_quotes'],
+                'total_products': summary['total_products'],
+                'total_content': summary['total_content'],
+                'top_authors': pd.DataFrame(summary['top_authors'], columns=['author', 'count']),
+                'recent_sessions': pd.DataFrame(session_rows, columns=session_columns)
             }
             
-            conn.close()
             return stats
             
         except Exception as e:
             self.logger.error(f"Error getting stats: {e}")
             return {}
     
-    def export_to_csv(self, table_name, filename=None):
-        """Export any table to CSV for backup or analysis"""
+    def query_records(self, table_name, filters=None, since=None, until=None, limit=50, after_id=None):
+        """
+        Query a data table, newest first, using the secondary indexes
+        filters: {column: value} equality filters (see QUERY_FILTERS)
+        since/until: scrape_timestamp range, e.g. '2025-11-08 00:00:00'
+        after_id: keyset pagination - pass the last id of the previous page
+        Returns a list of dicts
+        """
+        if table_name not in QUERY_FILTERS:
+            raise ValueError(f"Unknown table: {table_name}")
+        
+        conditions = []
+        params = []
+        
+        for column, value in (filters or {}).items():
+            if column not in QUERY_FILTERS[table_name]:
+                raise ValueError(f"Cannot filter {table_name} on {column}")
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                params.append(value)
+        
+        if since is not None:
+            conditions.append('scrape_timestamp >= ?')
+            params.append(since)
+        if until is not None:
+            conditions.append('scrape_timestamp < ?')
+            params.append(until)
+        if after_id is not None:
+            conditions.append('id < ?')
+            params.append(after_id)
+        
+        sql = f'SELECT * FROM {table_name}'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY id DESC LIMIT ?'
+        params.append(limit)
+        
+        cursor = self.connections.connection().execute(sql, params)
+        columns = [description[0] for description in cursor.description]
+        
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    def query_quotes(self, author=None, source_url=None, since=None, until=None, limit=50, after_id=None):
+        """Page through quotes filtered by author, source_url and/or time range"""
+        return self.query_records('quotes', {'author': author, 'source_url': source_url},
+                                  since=since, until=until, limit=limit, after_id=after_id)
+    
+    def query_products(self, source_url=None, since=None, until=None, limit=50, after_id=None):
+        """Page through products filtered by source_url and/or time range"""
+        return self.query_records('products', {'source_url': source_url},
+                                  since=since, until=until, limit=limit, after_id=after_id)
+    
+    def query_general_content(self, content_type=None, source_url=None, since=None, until=None, limit=50, after_id=None):
+        """Page through general content filtered by content_type, source_url and/or time range"""
+        return self.query_records('general_content', {'content_type': content_type, 'source_url': source_url},
+                                  since=since, until=until, limit=limit, after_id=after_id)
+    
+    def export_to_csv(self, table_name, filename=None, fmt='csv', chunk_size=10000):
+        """
+        Export any table for backup or analysis
+        Streams rows with a cursor chunk_size at a time, so memory stays flat
+        fmt: 'csv', 'csv.gz', 'jsonl' or 'parquet'
+        """
         try:
             if not filename:
-                filename = f"{table_name}_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                filename = f"{table_name}_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}{EXPORT_FORMATS.get(fmt, '')}"
             
-            conn = sqlite3.connect(self.db_name)
-            df = pd.read_sql(f'SELECT * FROM {table_name}', conn)
-            df.to_csv(filename, index=False)
-            conn.close()
+            conn = self.connections.connection()
+            total_rows = export_table(conn, table_name, filename, fmt=fmt, chunk_size=chunk_size)
             
-            self.logger.info(f"Exported {len(df)} records from {table_name} to {filename}")
+            self.logger.info(f"Exported {total_rows} records from {table_name} to {filename}")
             return filename
             
         except Exception as e:
@@ -0,0 +1,146 @@
+import hashlib
+import re
+import sqlite3
+import threading
+
+# Runs of whitespace, collapsed during normalisation
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalise_text(text):
+    """
+    Collapse whitespace so trivially different copies match
+    Case is kept - the same identity as drop_duplicates() on the cleaned text
+    """
+    return WHITESPACE_PATTERN.sub(' ', str(text or '')).strip()
+
+
+def content_fingerprint(text, source_url=''):
+    """
+    Stable 16-byte BLAKE2b fingerprint of normalised text + source_url
+    Unlike hash(), it is identical across processes and runs
+    """
+    key = normalise_text(text) + '\x1f' + (source_url or '')
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+
+
+class DedupStore:
+    """
+    Persistent dedup index of content fingerprints, backed by SQLite
+    Shared by the scrapers, the cleaner and the database writer so a record
+    that was seen once is never parsed or stored again, in any later run.
+    Each stage records under its own namespace (e.g. 'scraped', 'cleaned',
+    'general_content'), so one stage marking a record doesn't hide it from the next.
+    Check first (unseen/filter_unseen) and record only once the records are
+    safely stored (record/record_seen) - a failed write must not hide them
+    from the next run.
+    """
+
+    def __init__(self, db_name='dedup_index.db', batch_size=5000):
+        self.db_name = db_name
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+
+        self.conn = sqlite3.connect(db_name, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                namespace TEXT NOT NULL,
+                fingerprint BLOB NOT NULL,
+                first_seen DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (namespace, fingerprint)
+            ) WITHOUT ROWID
+        ''')
+        self.conn.commit()
+
+    def unseen(self, fingerprints, namespace='default'):
+        """
+        Return a list of booleans without recording anything:
+        True where a fingerprint is not in the store (and not earlier in this call)
+        """
+        fingerprints = list(fingerprints)
+        is_new = []
+
+        with self._lock:
+            for start in range(0, len(fingerprints), self.batch_size):
+                batch = fingerprints[start:start + self.batch_size]
+                placeholders = ','.join('?' * len(batch))
+                known = {
+                    row[0] for row in self.conn.execute(
+                        f'SELECT fingerprint FROM fingerprints WHERE namespace = ? AND fingerprint IN ({placeholders})',
+                        [namespace] + batch
+                    )
+                }
+
+                for fingerprint in batch:
+                    is_new.append(fingerprint not in known)
+                    known.add(fingerprint)
+
+        return is_new
+
+    def record(self, fingerprints, namespace='default'):
+        """Record fingerprints as seen (call after the records they stand for were stored)"""
+        with self._lock:
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO fingerprints (namespace, fingerprint) VALUES (?, ?)',
+                ((namespace, fingerprint) for fingerprint in fingerprints)
+            )
+            self.conn.commit()
+
+    def mark_new(self, fingerprints, namespace='default'):
+        """
+        unseen() and record() in one step, for stages that store nothing afterwards
+        Returns the same list of booleans as unseen()
+        """
+        fingerprints = list(fingerprints)
+        is_new = self.unseen(fingerprints, namespace)
+        self.record((fingerprint for fingerprint, new in zip(fingerprints, is_new) if new), namespace)
+        return is_new
+
+    def unseen_content(self, pairs, namespace='default'):
+        """
+        Like unseen, for (text, source_url) pairs
+        The second element can be any qualifier that is part of the record's identity
+        """
+        return self.unseen((content_fingerprint(text, source_url) for text, source_url in pairs), namespace)
+
+    def record_content(self, pairs, namespace='default'):
+        """Like record, for (text, source_url) pairs"""
+        self.record((content_fingerprint(text, source_url) for text, source_url in pairs), namespace)
+
+    def add(self, text, source_url='', namespace='default'):
+        """Record one piece of content; returns True if it was new"""
+        return self.mark_new([content_fingerprint(text, source_url)], namespace)[0]
+
+    def filter_unseen(self, records, text_key='content', url_key='source_url', namespace='default'):
+        """Return only the dict records whose (text, source_url) is not in the store (records nothing)"""
+        records = list(records)
+        is_new = self.unseen_content(
+            ((record.get(text_key, ''), record.get(url_key, '')) for record in records), namespace
+        )
+        return [record for record, new in zip(records, is_new) if new]
+
+    def record_seen(self, records, text_key='content', url_key='source_url', namespace='default'):
+        """Record dict records as seen once they are stored"""
+        self.record_content(((record.get(text_key, ''), record.get(url_key, '')) for record in records), namespace)
+
+    def seen(self, text, source_url='', namespace='default'):
+        """Check membership without recording anything"""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT 1 FROM fingerprints WHERE namespace = ? AND fingerprint = ?',
+                (namespace, content_fingerprint(text, source_url))
+            ).fetchone()
+        return row is not None
+
+    def count(self, namespace='default'):
+        """Number of fingerprints recorded under a namespace"""
+        with self._lock:
+            return self.conn.execute(
+                'SELECT COUNT(*) FROM fingerprints WHERE namespace = ?', (namespace,)
+            ).fetchone()[0]
+
+    def close(self):
+        """Close the index database"""
+        self.conn.close()
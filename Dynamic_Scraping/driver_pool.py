@@ -0,0 +1,149 @@
+import threading
+import queue
+import logging
+from concurrent.futures import Future
+
+from selenium_practice import DynamicContentScraper
+
+
+class SeleniumDriverPool:
+    """
+    Pool of warm headless Chrome drivers fed from a job queue
+    Each worker thread owns one DynamicContentScraper (one Chrome process),
+    so N workers scrape N sites in parallel on separate cores.
+    A worker's browser is recycled after max_pages_per_driver jobs to
+    keep Chrome's memory growth in check.
+    """
+
+    def __init__(self, size=4, max_pages_per_driver=50, headless=True, scraper_factory=None, dedup_store=None,
+                 archive=None, replay=None):
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        self.scraper_factory = scraper_factory or (
+            lambda: DynamicContentScraper(headless=headless, dedup_store=dedup_store, archive=archive,
+                                          replay=replay)
+        )
+        self.logger = logging.getLogger(__name__)
+
+        self.jobs = queue.Queue()
+        self.workers = []
+        self.started = False
+
+    def start(self):
+        """Start the worker threads; each one launches its browser right away"""
+        if self.started:
+            return self
+
+        for worker_id in range(self.size):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                args=(worker_id,),
+                name=f"selenium-worker-{worker_id}",
+                daemon=True
+            )
+            worker.start()
+            self.workers.append(worker)
+
+        self.started = True
+        self.logger.info(f"Started Selenium driver pool with {self.size} workers")
+        return self
+
+    def submit(self, site):
+        """
+        Queue one site for scraping and return a Future with its content list
+        site is a dict with 'url', 'type' ('infinite_scroll' or 'ajax'),
+        and optional 'name' and 'ready_selector'
+        """
+        if not self.started:
+            self.start()
+
+        future = Future()
+        self.jobs.put((site, future))
+        return future
+
+    def scrape_sites(self, sites):
+        """Scrape all sites in parallel and return {site url: content list}"""
+        futures = [(site, self.submit(site)) for site in sites]
+
+        results = {}
+        for site, future in futures:
+            try:
+                results[site['url']] = future.result()
+            except Exception as e:
+                self.logger.error(f"Selenium job failed for {site['url']}: {e}")
+                results[site['url']] = []
+
+        return results
+
+    def _worker_loop(self, worker_id):
+        """Take jobs from the queue until close() sends the stop signal"""
+        # Launch the browser before the first job arrives so it is warm
+        scraper = self._launch_scraper(worker_id)
+        pages_done = 0
+
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+
+            site, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                # Recycle the browser after max_pages_per_driver jobs
+                if scraper is not None and pages_done >= self.max_pages_per_driver:
+                    self.logger.info(f"Worker {worker_id}: recycling browser after {pages_done} pages")
+                    scraper.close()
+                    scraper = None
+
+                if scraper is None:
+                    scraper = self._launch_scraper(worker_id)
+                    pages_done = 0
+                    if scraper is None:
+                        raise RuntimeError("Chrome driver could not be started")
+
+                if site.get('type') == 'infinite_scroll':
+                    content = scraper.scrape_infinite_scroll_site(site['url'], ready_selector=site.get('ready_selector'))
+                else:
+                    content = scraper.scrape_ajax_site(site['url'], ready_selector=site.get('ready_selector'))
+
+                pages_done += 1
+                future.set_result(content)
+
+            except Exception as e:
+                future.set_exception(e)
+
+        if scraper is not None:
+            scraper.close()
+
+    def _launch_scraper(self, worker_id):
+        """Create a scraper for a worker, or None if Chrome failed to start"""
+        try:
+            scraper = self.scraper_factory()
+        except Exception as e:
+            self.logger.error(f"Worker {worker_id}: could not start browser: {e}")
+            return None
+
+        if scraper.driver is None:
+            return None
+
+        return scraper
+
+    def close(self):
+        """Stop all workers and quit their browsers"""
+        for _ in self.workers:
+            self.jobs.put(None)
+
+        for worker in self.workers:
+            worker.join()
+
+        self.workers = []
+        self.started = False
+        self.logger.info("Selenium driver pool closed")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
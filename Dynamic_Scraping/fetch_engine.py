@@ -0,0 +1,136 @@
+import threading
+import logging
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Default headers sent with every request made through the engine
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Connection': 'keep-alive'
+}
+
+# (connect timeout, read timeout) in seconds
+DEFAULT_TIMEOUT = (5, 30)
+
+
+class FetchEngine:
+    """
+    Shared HTTP fetch engine for the static (BeautifulSoup) scrapers
+    One requests.Session with pooled keep-alive connections per host,
+    so repeated fetches reuse TCP/TLS connections instead of reconnecting.
+    With an HttpCache, GETs become conditional requests (ETag/Last-Modified);
+    with a PageArchive, every fetched body is kept on disk for re-extraction;
+    with a ReplaySource, nothing goes to the network and captured bodies are served instead
+    """
+
+    def __init__(self, headers=None, timeout=DEFAULT_TIMEOUT, pool_connections=20,
+                 pool_maxsize=20, max_retries=2, cache=None, archive=None, replay=None):
+        self.timeout = timeout
+        # Optional HttpCache used for conditional requests
+        self.cache = cache
+        # Optional PageArchive that keeps the raw bodies
+        self.archive = archive
+        # Optional ReplaySource for offline runs
+        self.replay = replay
+        self.logger = logging.getLogger(__name__)
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+        # pool_connections = number of hosts to keep pools for,
+        # pool_maxsize = keep-alive connections kept open per host
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url, headers=None, timeout=None, cache=None, archive=None, replay=None, **kwargs):
+        """
+        GET a URL through the pooled session
+        Raises requests exceptions exactly like requests.get does.
+        With a cache (this call's or the engine's), the stored validators are
+        sent along; on 304 the response gets not_modified=True and the cached
+        body, so callers can skip parsing or keep using .content as before.
+        Successful bodies (including 304s served from cache) go to the archive.
+        In replay mode the captured response is returned (404 if never captured).
+        """
+        replay = replay or self.replay
+        if replay:
+            response = replay.response(url)
+            response.not_modified = False
+            self.logger.debug(f"REPLAY {url} -> {response.status_code}")
+            return response
+        
+        cache = cache or self.cache
+        archive = archive or self.archive
+        entry = cache.lookup(url) if cache else None
+        if entry:
+            headers = dict(cache.conditional_headers(entry), **(headers or {}))
+        
+        response = self.session.get(
+            url,
+            headers=headers,
+            timeout=timeout or self.timeout,
+            **kwargs
+        )
+        self.logger.debug(f"GET {url} -> {response.status_code} ({urlsplit(url).netloc})")
+        
+        response.not_modified = False
+        if cache:
+            if response.status_code == 304 and entry:
+                response.not_modified = True
+                response._content = entry['body']
+                response.encoding = entry['encoding']
+                cache.touch(url, response)
+                self.logger.debug(f"Not modified, served {url} from cache")
+            else:
+                cache.store(url, response)
+        
+        if archive and (response.status_code == 200 or response.not_modified):
+            try:
+                archive.store(url, response.content, source='http')
+            except Exception as e:
+                self.logger.warning(f"Could not archive {url}: {e}")
+        
+        return response
+
+    def fetch(self, url, **kwargs):
+        """GET a URL and raise for bad status codes"""
+        response = self.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+_shared_engine = None
+_shared_engine_lock = threading.Lock()
+
+
+def get_fetch_engine():
+    """Return the process-wide shared FetchEngine (created on first use)"""
+    global _shared_engine
+
+    if _shared_engine is None:
+        with _shared_engine_lock:
+            if _shared_engine is None:
+                _shared_engine = FetchEngine()
+
+    return _shared_engine
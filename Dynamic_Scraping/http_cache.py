@@ -0,0 +1,119 @@
+import os
+import sqlite3
+import threading
+import logging
+
+class HttpCache:
+    """
+    On-disk HTTP revalidation cache, backed by SQLite
+    Stores the last 200 body of each URL together with its validators
+    (ETag / Last-Modified) so the next fetch can be a conditional request.
+    A 304 answer then costs one round trip and no download.
+    """
+
+    def __init__(self, db_name='http_cache.db'):
+        self.db_name = db_name
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        self.conn = sqlite3.connect(db_name, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT,
+                encoding TEXT,
+                body BLOB NOT NULL,
+                stored_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                validated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        self.conn.commit()
+
+    def lookup(self, url):
+        """Return the cached entry for url as a dict, or None"""
+        with self._lock:
+            cursor = self.conn.execute(
+                'SELECT url, etag, last_modified, content_type, encoding, body, stored_at FROM http_cache WHERE url = ?',
+                (url,)
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip([description[0] for description in cursor.description], row))
+
+    def conditional_headers(self, entry):
+        """If-None-Match / If-Modified-Since headers for a cached entry"""
+        headers = {}
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response):
+        """
+        Cache a 200 response if it carries a validator
+        Responses without ETag or Last-Modified can't be revalidated, so they're skipped
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code != 200 or not (etag or last_modified):
+            return False
+
+        with self._lock:
+            self.conn.execute('''
+                INSERT INTO http_cache (url, etag, last_modified, content_type, encoding, body)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_type = excluded.content_type,
+                    encoding = excluded.encoding,
+                    body = excluded.body,
+                    stored_at = CURRENT_TIMESTAMP,
+                    validated_at = CURRENT_TIMESTAMP
+            ''', (url, etag, last_modified, response.headers.get('Content-Type'), response.encoding, response.content))
+            self.conn.commit()
+        return True
+
+    def touch(self, url, response):
+        """Record a successful revalidation (304), picking up any refreshed validators"""
+        with self._lock:
+            self.conn.execute('''
+                UPDATE http_cache SET
+                    etag = COALESCE(?, etag),
+                    last_modified = COALESCE(?, last_modified),
+                    validated_at = CURRENT_TIMESTAMP
+                WHERE url = ?
+            ''', (response.headers.get('ETag'), response.headers.get('Last-Modified'), url))
+            self.conn.commit()
+
+    def invalidate(self, url=None):
+        """Drop one URL, or the whole cache when url is None"""
+        with self._lock:
+            if url is None:
+                self.conn.execute('DELETE FROM http_cache')
+            else:
+                self.conn.execute('DELETE FROM http_cache WHERE url = ?', (url,))
+            self.conn.commit()
+
+    def close(self):
+        """Close the cache database"""
+        self.conn.close()
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_http_cache(db_name='http_cache.db'):
+    """Return the process-wide HttpCache for db_name (one per cache file)"""
+    key = os.path.abspath(db_name)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = HttpCache(db_name)
+        return _caches[key]
@@ -3,13 +3,20 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
 import pandas as pd
 import time
-import re
+
+from readiness import PageReadiness
+from page_parsers import parse_page_data, parse_products
 
 class MultiPageScraper:
-    def __init__(self):
+    def __init__(self, page_delay=0, archive=None, replay=None):
+        # Optional politeness delay between pages; page loads are detected by readiness checks
+        self.page_delay = page_delay
+        # Optional PageArchive; every page_source that gets parsed is kept on disk
+        self.archive = archive
+        # Optional ReplayServer; pages come from captured copies instead of the live site
+        self.replay = replay
         self.setup_driver()
         self.all_data = []
         
@@ -21,11 +28,13 @@ class MultiPageScraper:
         chrome_options.add_argument("--disable-dev-shm-usage")
         
         self.driver = webdriver.Chrome(options=chrome_options)
+        self.readiness = PageReadiness(self.driver)
         print("✅ Chrome driver setup successfully!")
     
-    def scrape_pagination_site(self, base_url, max_pages=3):
+    def scrape_pagination_site(self, base_url, max_pages=3, ready_selector=None):
         """
         Scrape a website with pagination (multiple pages)
+        ready_selector: optional site-specific CSS selector that marks loaded content
         """
         print(f"Scraping pagination site: {base_url}")
         
@@ -41,12 +50,13 @@ class MultiPageScraper:
                 url = f"{base_url}?page={current_page}"  # Adjust based on site structure
             
             try:
-                self.driver.get(url)
+                self.driver.get(self.replay.url_for(url) if self.replay is not None else url)
                 
                 # Wait for content to load
                 WebDriverWait(self.driver, 10).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
+                self.readiness.wait_until_settled(selector=ready_selector, timeout=10)
                 
                 # Extract data from current page
                 page_data = self.extract_page_data(current_page)
@@ -60,7 +70,8 @@ class MultiPageScraper:
                     break
                     
                 current_page += 1
-                time.sleep(2)  # Be respectful
+                if self.page_delay:
+                    time.sleep(self.page_delay)  # Be respectful
                 
             except Exception as e:
                 print(f"Error on page {current_page}: {e}")
@@ -68,46 +79,25 @@ class MultiPageScraper:
         
         return self.all_data
     
-    def extract_page_data(self, page_number):
-        """Extract data from current page"""
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        page_data = []
-        
-        # Extract quotes (for quotes.toscrape.com)
-        quotes = soup.find_all('div', class_='quote')
-        for quote in quotes:
+    def page_url(self):
+        """Current page URL, mapped back to the original site in replay mode"""
+        if self.replay is not None:
+            return self.replay.original_url(self.driver.current_url)
+        return self.driver.current_url
+    
+    def snapshot_page_source(self):
+        """Return the current page_source, archiving it first if an archive is set"""
+        page_source = self.driver.page_source
+        if self.archive is not None:
             try:
-                text_elem = quote.find('span', class_='text')
-                author_elem = quote.find('small', class_='author')
-                tags_elems = quote.find_all('a', class_='tag')
-                
-                if text_elem and author_elem:
-                    data = {
-                        'page': page_number,
-                        'type': 'quote',
-                        'text': text_elem.get_text().strip(),
-                        'author': author_elem.get_text().strip(),
-                        'tags': ', '.join([tag.get_text() for tag in tags_elems]),
-                        'source_url': self.driver.current_url
-                    }
-                    page_data.append(data)
+                self.archive.store(self.page_url(), page_source, source='selenium')
             except Exception as e:
-                print(f"Error extracting quote: {e}")
-        
-        # If no quotes found, extract general content
-        if not page_data:
-            paragraphs = soup.find_all('p')
-            for i, p in enumerate(paragraphs[:10]):
-                text = p.get_text().strip()
-                if text and len(text) > 10:
-                    page_data.append({
-                        'page': page_number,
-                        'type': 'paragraph',
-                        'content': text,
-                        'source_url': self.driver.current_url
-                    })
-        
-        return page_data
+                print(f"Could not archive page source: {e}")
+        return page_source
+    
+    def extract_page_data(self, page_number):
+        """Extract data from current page"""
+        return parse_page_data(self.snapshot_page_source(), page_number, self.page_url())
     
     def go_to_next_page(self):
         """Try to navigate to next page"""
@@ -118,11 +108,13 @@ class MultiPageScraper:
             
             for button in next_buttons:
                 if button.is_displayed() and button.is_enabled():
+                    self.readiness.mark_page()
                     button.click()
-                    # Wait for next page to load
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
+                    
+                    # Returns on a full navigation or on the first AJAX DOM update,
+                    # whichever comes first - then wait for the new content to settle
+                    self.readiness.wait_for_page_change(timeout=10)
+                    self.readiness.wait_until_settled(timeout=10)
                     return True
                     
         except Exception as e:
@@ -136,38 +128,14 @@ class MultiPageScraper:
         """
         print(f"Scraping e-commerce site: {url}")
         
-        self.driver.get(url)
+        self.driver.get(self.replay.url_for(url) if self.replay is not None else url)
         WebDriverWait(self.driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        
-        products_data = []
+        self.readiness.wait_until_settled(timeout=10)
         
         # Extract product information
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        
-        # Look for product elements (adjust selectors based on site)
-        products = soup.find_all(['div', 'article'], class_=lambda x: x and any(word in str(x).lower() for word in ['product', 'item', 'card']))
-        
-        for product in products[:10]:  # Limit to first 10 products
-            try:
-                name_elem = product.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', '.title', '.name'])
-                price_elem = product.find(['.price', '.cost', '[class*="price"]'])
-                desc_elem = product.find(['p', '.description', '.desc'])
-                
-                product_data = {
-                    'type': 'product',
-                    'name': name_elem.get_text().strip() if name_elem else 'N/A',
-                    'price': price_elem.get_text().strip() if price_elem else 'N/A',
-                    'description': desc_elem.get_text().strip() if desc_elem else 'N/A',
-                    'source_url': self.driver.current_url
-                }
-                products_data.append(product_data)
-                
-            except Exception as e:
-                print(f"Error extracting product: {e}")
-        
-        return products_data
+        return parse_products(self.snapshot_page_source(), self.page_url())
     
     def close(self):
         """Close the browser"""
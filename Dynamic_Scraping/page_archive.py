@@ -0,0 +1,159 @@
+import os
+import gzip
+import hashlib
+import sqlite3
+import tempfile
+import threading
+import logging
+from datetime import datetime
+
+# zstd is optional - fall back to gzip when the zstandard package isn't installed
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def compress(data, codec):
+    """Compress bytes with 'zstd' or 'gzip'"""
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def decompress(data, codec):
+    """Inverse of compress()"""
+    if codec == 'zstd':
+        if zstandard is None:
+            raise ImportError("This snapshot is zstd-compressed: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class PageArchive:
+    """
+    Content-addressed archive of raw pages (HTTP bodies and Selenium page_source)
+    Each distinct body is stored once, compressed, under its SHA-256 digest;
+    a SQLite index maps (url, fetched_at) to digests. Changing a selector then
+    means re-extracting from disk instead of crawling the live sites again.
+    """
+
+    def __init__(self, root='page_archive', codec=None):
+        self.root = root
+        self.codec = codec or ('zstd' if zstandard is not None else 'gzip')
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+
+        self.conn = sqlite3.connect(os.path.join(root, 'index.db'), check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                codec TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                source TEXT NOT NULL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_snapshots_url_time ON snapshots (url, fetched_at)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_snapshots_time ON snapshots (fetched_at)')
+        self.conn.commit()
+
+    def object_path(self, digest, codec):
+        """Blob location: objects/ab/abcdef....<codec>"""
+        extension = '.zst' if codec == 'zstd' else '.gz'
+        return os.path.join(self.root, 'objects', digest[:2], digest + extension)
+
+    def store(self, url, body, source='http', fetched_at=None):
+        """
+        Archive one page body (str or bytes) and return its digest
+        Identical bodies share one blob; every call adds an index row
+        """
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        digest = hashlib.sha256(body).hexdigest()
+        fetched_at = fetched_at or datetime.now().isoformat(timespec='seconds')
+        path = self.object_path(digest, self.codec)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file and rename, so readers never see half a blob
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, 'wb') as blob:
+                blob.write(compress(body, self.codec))
+            os.replace(temp_path, path)
+
+        with self._lock:
+            self.conn.execute(
+                'INSERT INTO snapshots (url, fetched_at, digest, codec, size, source) VALUES (?, ?, ?, ?, ?, ?)',
+                (url, fetched_at, digest, self.codec, len(body), source)
+            )
+            self.conn.commit()
+
+        self.logger.debug(f"Archived {url} as {digest[:12]} ({len(body)} bytes, {source})")
+        return digest
+
+    def load(self, digest, codec=None):
+        """Return the raw bytes stored under digest"""
+        codec = codec or self.codec
+        with open(self.object_path(digest, codec), 'rb') as blob:
+            return decompress(blob.read(), codec)
+
+    def snapshots(self, url=None, since=None, until=None, source=None, latest_only=False):
+        """
+        Index rows as dicts, oldest first, filtered by url / fetch time / source
+        latest_only keeps just the newest snapshot of each URL
+        """
+        conditions = []
+        params = []
+        if url is not None:
+            conditions.append('url = ?')
+            params.append(url)
+        if since is not None:
+            conditions.append('fetched_at >= ?')
+            params.append(since)
+        if until is not None:
+            conditions.append('fetched_at <= ?')
+            params.append(until)
+        if source is not None:
+            conditions.append('source = ?')
+            params.append(source)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        if latest_only:
+            sql = f'''
+                SELECT * FROM snapshots WHERE id IN (
+                    SELECT MAX(id) FROM snapshots {where} GROUP BY url
+                ) ORDER BY fetched_at, id
+            '''
+        else:
+            sql = f'SELECT * FROM snapshots {where} ORDER BY fetched_at, id'
+
+        with self._lock:
+            cursor = self.conn.execute(sql, params)
+            columns = [description[0] for description in cursor.description]
+            rows = cursor.fetchall()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def latest(self, url):
+        """Newest snapshot row for url, or None"""
+        rows = self.snapshots(url=url, latest_only=True)
+        return rows[0] if rows else None
+
+    def iter_pages(self, **filters):
+        """
+        Yield (snapshot row, body bytes) for re-extraction jobs
+        Takes the same filters as snapshots(); blobs are read lazily one at a time
+        """
+        for snapshot in self.snapshots(**filters):
+            yield snapshot, self.load(snapshot['digest'], snapshot['codec'])
+
+    def close(self):
+        """Close the index database"""
+        self.conn.close()
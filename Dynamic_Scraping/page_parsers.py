@@ -0,0 +1,116 @@
+from bs4 import BeautifulSoup
+
+# Pure HTML -> records parsers used by the Selenium scrapers.
+# They take page source instead of a driver, so the same code runs on live
+# pages, archived snapshots, replayed fixtures and in the benchmarks.
+
+
+def parse_page_content(html, list_item_limit=20):
+    """
+    Paragraphs, headings and list items of a page, as [{'type', 'content'}]
+    Extraction logic of DynamicContentScraper.get_page_content()
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Extract various elements that might contain data
+    content = []
+
+    # Get all paragraphs
+    paragraphs = soup.find_all('p')
+    for p in paragraphs:
+        text = p.get_text().strip()
+        if text and len(text) > 5:
+            content.append({'type': 'paragraph', 'content': text})
+
+    # Get all headings
+    headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+    for h in headings:
+        text = h.get_text().strip()
+        if text:
+            content.append({'type': 'heading', 'content': text})
+
+    # Get all list items
+    list_items = soup.find_all('li')
+    for li in list_items[:list_item_limit]:  # Limit to avoid too much data
+        text = li.get_text().strip()
+        if text and len(text) > 3:
+            content.append({'type': 'list_item', 'content': text})
+
+    return content
+
+
+def parse_page_data(html, page_number, source_url):
+    """
+    Quotes of a listing page, or its paragraphs when there are no quotes
+    Extraction logic of MultiPageScraper.extract_page_data()
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    page_data = []
+
+    # Extract quotes (for quotes.toscrape.com)
+    quotes = soup.find_all('div', class_='quote')
+    for quote in quotes:
+        try:
+            text_elem = quote.find('span', class_='text')
+            author_elem = quote.find('small', class_='author')
+            tags_elems = quote.find_all('a', class_='tag')
+
+            if text_elem and author_elem:
+                data = {
+                    'page': page_number,
+                    'type': 'quote',
+                    'text': text_elem.get_text().strip(),
+                    'author': author_elem.get_text().strip(),
+                    'tags': ', '.join([tag.get_text() for tag in tags_elems]),
+                    'source_url': source_url
+                }
+                page_data.append(data)
+        except Exception as e:
+            print(f"Error extracting quote: {e}")
+
+    # If no quotes found, extract general content
+    if not page_data:
+        paragraphs = soup.find_all('p')
+        for i, p in enumerate(paragraphs[:10]):
+            text = p.get_text().strip()
+            if text and len(text) > 10:
+                page_data.append({
+                    'page': page_number,
+                    'type': 'paragraph',
+                    'content': text,
+                    'source_url': source_url
+                })
+
+    return page_data
+
+
+def parse_products(html, source_url, limit=10):
+    """
+    Product cards of an e-commerce listing
+    Extraction logic of MultiPageScraper.scrape_ecommerce_site()
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    products_data = []
+
+    # Look for product elements (adjust selectors based on site)
+    products = soup.find_all(['div', 'article'], class_=lambda x: x and any(word in str(x).lower() for word in ['product', 'item', 'card']))
+
+    for product in products[:limit]:  # Limit to first 10 products
+        try:
+            name_elem = product.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', '.title', '.name'])
+            price_elem = product.find(['.price', '.cost', '[class*="price"]'])
+            desc_elem = product.find(['p', '.description', '.desc'])
+
+            product_data = {
+                'type': 'product',
+                'name': name_elem.get_text().strip() if name_elem else 'N/A',
+                'price': price_elem.get_text().strip() if price_elem else 'N/A',
+                'description': desc_elem.get_text().strip() if desc_elem else 'N/A',
+                'source_url': source_url
+            }
+            products_data.append(product_data)
+
+        except Exception as e:
+            print(f"Error extracting product: {e}")
+
+    return products_data
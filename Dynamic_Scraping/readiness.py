@@ -0,0 +1,175 @@
+import time
+import logging
+
+# Installed once per page: records the time of the last DOM mutation and
+# counts fetch/XHR requests that are still in flight
+INSTALL_MONITOR_JS = """
+if (!window.__readinessMonitor) {
+    var monitor = {lastMutation: performance.now(), pending: 0};
+    window.__readinessMonitor = monitor;
+
+    new MutationObserver(function() {
+        monitor.lastMutation = performance.now();
+    }).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+
+    if (performance.setResourceTimingBufferSize) {
+        performance.setResourceTimingBufferSize(5000);
+    }
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        monitor.pending += 1;
+        this.addEventListener('loadend', function() { monitor.pending -= 1; });
+        return originalSend.apply(this, arguments);
+    };
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function() {
+            monitor.pending += 1;
+            return originalFetch.apply(this, arguments).finally(function() { monitor.pending -= 1; });
+        };
+    }
+}
+"""
+
+DOM_QUIET_JS = INSTALL_MONITOR_JS + """
+return performance.now() - window.__readinessMonitor.lastMutation;
+"""
+
+NETWORK_STATE_JS = INSTALL_MONITOR_JS + """
+var entries = performance.getEntriesByType('resource');
+var lastResponse = 0;
+for (var i = 0; i < entries.length; i++) {
+    lastResponse = Math.max(lastResponse, entries[i].responseEnd || entries[i].startTime);
+}
+return [document.readyState, window.__readinessMonitor.pending, performance.now() - lastResponse];
+"""
+
+# Remembers "now" on the current document, before an action that should change the page
+MARK_PAGE_JS = INSTALL_MONITOR_JS + """
+window.__readinessPageMark = performance.now();
+"""
+
+# A new document (full navigation) has no mark; an AJAX update mutates the DOM after it
+PAGE_CHANGED_JS = INSTALL_MONITOR_JS + """
+var mark = window.__readinessPageMark;
+return mark === undefined || window.__readinessMonitor.lastMutation > mark;
+"""
+
+ELEMENT_COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+
+class PageReadiness:
+    """
+    Condition-driven waits for Selenium pages
+    Instead of sleeping a fixed number of seconds, poll real signals
+    (DOM mutation quiescence, network idle, element-count growth,
+    site-specific selectors) and return as soon as the page has settled.
+    Every wait returns {'signal', 'ready', 'elapsed'} and never raises on timeout.
+    """
+
+    def __init__(self, driver, poll_interval=0.1):
+        self.driver = driver
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger(__name__)
+
+    def _poll(self, signal, check, timeout):
+        """Call check() until it returns True or timeout seconds have passed"""
+        start_time = time.time()
+        ready = False
+
+        while True:
+            try:
+                ready = bool(check())
+            except Exception as e:
+                # Page may be mid-navigation; treat as not ready yet
+                self.logger.debug(f"Readiness check '{signal}' failed: {e}")
+                ready = False
+
+            elapsed = time.time() - start_time
+            if ready or elapsed >= timeout:
+                break
+            time.sleep(self.poll_interval)
+
+        result = {'signal': signal, 'ready': ready, 'elapsed': round(elapsed, 3)}
+        if ready:
+            self.logger.debug(f"Ready on '{signal}' after {elapsed:.2f}s")
+        else:
+            self.logger.debug(f"Timed out waiting for '{signal}' after {elapsed:.2f}s")
+        return result
+
+    def count_elements(self, css_selector):
+        """Number of elements currently matching css_selector"""
+        return self.driver.execute_script(ELEMENT_COUNT_JS, css_selector)
+
+    def wait_for_selector(self, css_selector, timeout=10):
+        """Wait until at least one element matches css_selector"""
+        return self._poll(
+            f"selector:{css_selector}",
+            lambda: self.count_elements(css_selector) > 0,
+            timeout
+        )
+
+    def wait_for_element_count_growth(self, css_selector, previous_count, timeout=10):
+        """Wait until more than previous_count elements match css_selector"""
+        return self._poll(
+            f"growth:{css_selector}",
+            lambda: self.count_elements(css_selector) > previous_count,
+            timeout
+        )
+
+    def wait_for_dom_quiet(self, quiet_period=0.5, timeout=10):
+        """Wait until the DOM has not changed for quiet_period seconds"""
+        return self._poll(
+            'dom_quiet',
+            lambda: self.driver.execute_script(DOM_QUIET_JS) >= quiet_period * 1000,
+            timeout
+        )
+
+    def wait_for_network_idle(self, idle_period=0.5, timeout=10):
+        """Wait until the document is loaded, no fetch/XHR is pending and nothing arrived for idle_period seconds"""
+        def is_idle():
+            ready_state, pending, since_last_response = self.driver.execute_script(NETWORK_STATE_JS)
+            return ready_state == 'complete' and pending <= 0 and since_last_response >= idle_period * 1000
+
+        return self._poll('network_idle', is_idle, timeout)
+
+    def mark_page(self):
+        """Mark the current document; call right before a click that should change the page"""
+        self.driver.execute_script(MARK_PAGE_JS)
+
+    def wait_for_page_change(self, timeout=10):
+        """
+        Wait until the page marked by mark_page() changed: a new document was
+        loaded, or the DOM was mutated (AJAX pagination keeps the document)
+        """
+        return self._poll('page_change', lambda: self.driver.execute_script(PAGE_CHANGED_JS), timeout)
+
+    def wait_until_settled(self, selector=None, count_selector=None, previous_count=None,
+                           quiet_period=0.5, timeout=10):
+        """
+        Run the relevant waits in order under one shared timeout:
+        site selector -> element-count growth -> network idle -> DOM quiet
+        Returns {'signal': 'settled', 'ready', 'elapsed', 'steps'}
+        """
+        start_time = time.time()
+        steps = []
+
+        def remaining():
+            return max(0.0, timeout - (time.time() - start_time))
+
+        if selector:
+            steps.append(self.wait_for_selector(selector, timeout=remaining()))
+
+        if count_selector and previous_count is not None:
+            steps.append(self.wait_for_element_count_growth(count_selector, previous_count, timeout=remaining()))
+
+        steps.append(self.wait_for_network_idle(idle_period=quiet_period, timeout=remaining()))
+        steps.append(self.wait_for_dom_quiet(quiet_period=quiet_period, timeout=remaining()))
+
+        elapsed = time.time() - start_time
+        ready = all(step['ready'] for step in steps)
+        self.logger.info(f"Page settled={ready} in {elapsed:.2f}s ({', '.join(step['signal'] for step in steps)})")
+
+        return {'signal': 'settled', 'ready': ready, 'elapsed': round(elapsed, 3), 'steps': steps}
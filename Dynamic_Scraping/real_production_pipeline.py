@@ -1,9 +1,9 @@
 import schedule
 import time
+import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-import pandas as pd
-import sqlite3
 import sys
 import os
 
@@ -12,17 +12,180 @@ sys.path.append('Dynamic_Scraping')
 
 # Now import ACTUAL scrapers
 try:
-    from selenium_practice import DynamicContentScraper  #Selenium class
+    # The pool runs DynamicContentScraper instances from selenium_practice.py
+    from driver_pool import SeleniumDriverPool
     print("SUCCESS: Imported Selenium scraper")
 except ImportError as e:
     print(f"ERROR: Could not import Selenium scraper: {e}")
 
+from fetch_engine import get_fetch_engine
+from http_cache import get_http_cache
+from page_archive import PageArchive
+from replay import ReplayServer
+from connection_manager import get_connection_manager
+from static_extractor import extract_static_content
+from async_crawler import AsyncCrawler
+from stage_executor import StageExecutor
+from streaming_writer import StreamingWriter
+from schema_migrations import apply_migrations, add_column_if_missing, add_unique_key
+from record_writer import RecordWriter, as_text, as_int
+
+# Natural keys of the pipeline tables; repeated runs refresh these rows instead of appending
+PIPELINE_NATURAL_KEYS = {
+    'quotes_new': ('quote_text', 'author'),
+    'general_content_new': ('content_type', 'content_text', 'source_url')
+}
+
+def create_pipeline_tables(cursor):
+    """Pipeline tables, created only if missing"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS quotes_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            quote_text TEXT NOT NULL,
+            author TEXT NOT NULL,
+            tags TEXT,
+            page_number INTEGER,
+            source_url TEXT,
+            scrape_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            data_quality_score INTEGER DEFAULT 100,
+            scraper_type TEXT
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS general_content_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content_type TEXT NOT NULL,
+            content_text TEXT NOT NULL,
+            source_url TEXT,
+            content_length INTEGER,
+            word_count INTEGER,
+            scrape_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            scraper_type TEXT
+        )
+    ''')
+
+def add_pipeline_columns(cursor):
+    """
+    Columns the pipeline writes that tables from older versions may lack
+    (the old startup code dropped and recreated quotes_new to get them)
+    """
+    for column, declaration in [
+        ('tags', 'TEXT'),
+        ('page_number', 'INTEGER'),
+        ('source_url', 'TEXT'),
+        ('scrape_timestamp', 'DATETIME'),
+        ('data_quality_score', 'INTEGER DEFAULT 100'),
+        ('scraper_type', 'TEXT')
+    ]:
+        add_column_if_missing(cursor, 'quotes_new', column, declaration)
+    
+    for column, declaration in [
+        ('source_url', 'TEXT'),
+        ('content_length', 'INTEGER'),
+        ('word_count', 'INTEGER'),
+        ('scrape_timestamp', 'DATETIME'),
+        ('scraper_type', 'TEXT')
+    ]:
+        add_column_if_missing(cursor, 'general_content_new', column, declaration)
+
+def add_pipeline_natural_keys(cursor):
+    """UNIQUE natural keys so the pipeline can upsert; older duplicates are collapsed to the newest row"""
+    for table_name, key_columns in PIPELINE_NATURAL_KEYS.items():
+        add_unique_key(cursor, f'ux_{table_name}_natural_key', table_name, key_columns)
+
+# Versioned schema steps for the pipeline tables (component 'pipeline' in schema_version)
+# Append new steps with the next version number - never edit applied ones
+PIPELINE_MIGRATIONS = [
+    (1, 'pipeline tables', create_pipeline_tables),
+    (2, 'columns missing from older pipeline tables', add_pipeline_columns),
+    (3, 'UNIQUE natural keys for upserts', add_pipeline_natural_keys)
+]
+
+# Typed writers from converted records to the pipeline tables, upserting on the natural keys.
+# The second element lists the record keys a column is read from, in order of preference
+PIPELINE_WRITERS = {
+    'quotes_new': RecordWriter('quotes_new', [
+        ('quote_text', ('quote_text', 'text'), as_text, ''),
+        ('author', 'author', as_text, 'Unknown'),
+        ('tags', 'tags', as_text, None),
+        ('page_number', ('page_number', 'page'), as_int, None),
+        ('source_url', 'source_url', as_text, ''),
+        ('scraper_type', 'scraper_type', as_text, None)
+    ], conflict_columns=PIPELINE_NATURAL_KEYS['quotes_new']),
+    'general_content_new': RecordWriter('general_content_new', [
+        ('content_type', ('content_type', 'type'), as_text, 'unknown'),
+        ('content_text', ('content_text', 'content'), as_text, ''),
+        ('source_url', 'source_url', as_text, ''),
+        ('content_length', 'content_length', as_int, None),
+        ('word_count', 'word_count', as_int, None),
+        ('scraper_type', 'scraper_type', as_text, None)
+    ], conflict_columns=PIPELINE_NATURAL_KEYS['general_content_new'])
+}
+
+# Dynamic sites scraped by the Selenium phase
+PRACTICE_SITES = [
+    {
+        'name': 'Infinite Scroll Practice',
+        'url': 'https://quotes.toscrape.com/scroll',
+        'type': 'infinite_scroll',
+        'ready_selector': 'div.quote'
+    },
+    {
+        'name': 'AJAX Content Practice',
+        'url': 'https://webscraper.io/test-sites/e-commerce/ajax',
+        'type': 'ajax',
+        'ready_selector': 'div.thumbnail'
+    }
+]
+
+# Recurring jobs for the scheduler daemon. every_minutes is a (min, max) range:
+# each run is scheduled a random number of minutes in that range after the last one
+SCHEDULED_SOURCES = [
+    {
+        'name': 'passiton_quotes',
+        'kind': 'static',
+        'url': 'https://www.passiton.com/inspirational-quotes/',
+        'every_minutes': (25, 35)
+    },
+    {
+        'name': 'quotes_infinite_scroll',
+        'kind': 'selenium',
+        'site': PRACTICE_SITES[0],
+        'every_minutes': (50, 70)
+    },
+    {
+        'name': 'ecommerce_ajax',
+        'kind': 'selenium',
+        'site': PRACTICE_SITES[1],
+        'every_minutes': (110, 130)
+    }
+]
+
 class TrueCombinedPipeline:
     """
     This TRULY combines existing scrapers by IMPORTING them
     """
     
-    def __init__(self):
+    def __init__(self, selenium_pool_size=4, max_pages_per_driver=50, dedup_store=None, http_cache=None,
+                 archive=None, replay=None):
+        self.selenium_pool_size = selenium_pool_size
+        self.max_pages_per_driver = max_pages_per_driver
+        # Optional persistent DedupStore shared by the Selenium scrapers: items stored in
+        # earlier runs are skipped. Off by default - the pipeline tables upsert on their
+        # natural keys, so re-scraped rows are refreshed instead of being dropped
+        self.dedup_store = dedup_store
+        # Optional HttpCache for conditional requests in the BeautifulSoup phase
+        self.http_cache = http_cache
+        # Optional PageArchive keeping raw HTTP bodies and Selenium snapshots
+        self.archive = archive
+        # Optional ReplaySource: run every phase offline against captured pages
+        self.replay = replay
+        # Long-lived driver pool (and replay server) kept warm between runs, see start_selenium_pool()
+        self.selenium_pool = None
+        self.replay_server = None
+        # StreamingWriter of the current run_true_combined_pipeline(); phases emit records to it
+        self.writer = None
         self.setup_logging()
         self.setup_database()
         self.logger = logging.getLogger(__name__)
@@ -40,146 +203,140 @@ class TrueCombinedPipeline:
     
     def setup_database(self):
         """Setup database connection and ensure proper schema"""
-        self.conn = sqlite3.connect('scraping_data.db')
+        # Reuse the same persistent WAL connection as ScrapingDatabase instead of opening a second one
+        self.connections = get_connection_manager('scraping_data.db')
+        self.conn = self.connections.connection()
         
         # Ensure the tables have the correct schema for our new data
         self.create_tables_if_not_exist()
     
     def create_tables_if_not_exist(self):
-        """Create tables with proper schema if they don't exist"""
-        cursor = self.conn.cursor()
-        
-        # Drop and recreate quotes table with correct schema
-        cursor.execute('DROP TABLE IF EXISTS quotes_new')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS quotes_new (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                quote_text TEXT NOT NULL,
-                author TEXT NOT NULL,
-                tags TEXT,
-                page_number INTEGER,
-                source_url TEXT,
-                scrape_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                data_quality_score INTEGER DEFAULT 100,
-                scraper_type TEXT
-            )
-        ''')
-        
-        # Create general_content table if not exists
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS general_content_new (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                content_type TEXT NOT NULL,
-                content_text TEXT NOT NULL,
-                source_url TEXT,
-                content_length INTEGER,
-                word_count INTEGER,
-                scrape_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                scraper_type TEXT
-            )
-        ''')
-        
-        self.conn.commit()
+        """
+        Create or upgrade the pipeline tables through versioned migrations
+        Existing rows are kept - tables grow across runs instead of being rebuilt
+        """
+        with self.connections.write() as conn:
+            apply_migrations(conn.cursor(), 'pipeline', PIPELINE_MIGRATIONS, logging.getLogger(__name__))
     
-    def run_actual_beautifulsoup_scraper(self):
+    def run_actual_beautifulsoup_scraper(self, url="https://www.passiton.com/inspirational-quotes/"):
         """
         Actually calls ORIGINAL BeautifulSoup scraper logic
         """
         self.logger.info("Calling ACTUAL BeautifulSoup scraper...")
         
         try:
-            import requests
-            from bs4 import BeautifulSoup
-            
             # This is the ACTUAL logic from web-scrap-enhance.py
-            url = "https://www.passiton.com/inspirational-quotes/"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            scraped_data = {}
-            
-            # Extract page title
-            page_title = soup.find('title')
-            if page_title:
-                scraped_data['page_title'] = page_title.get_text().strip()
+            # Conditional request against the HTTP cache; unchanged pages are not re-parsed
+            if self.replay is not None:
+                response = get_fetch_engine().fetch(url, replay=self.replay)
+            else:
+                response = get_fetch_engine().fetch(url, cache=self.http_cache, archive=self.archive)
+            if response.not_modified:
+                self.logger.info("BeautifulSoup: page not modified since last run, skipping extraction")
+                return {}
             
-            # Extract links (original logic)
-            links = soup.find_all('a', href=True)
-            scraped_data['links'] = []
-            
-            for link in links[:10]:
-                link_data = {
-                    'text': link.get_text().strip()[:50],
-                    'url': link['href']
-                }
-                scraped_data['links'].append(link_data)
-            
-            # Extract paragraphs  
-            paragraphs = soup.find_all('p')
-            scraped_data['paragraphs'] = []
-            
-            for para in paragraphs[:5]:
-                text = para.get_text().strip()
-                if text and len(text) > 10:
-                    scraped_data['paragraphs'].append(text[:200])
+            scraped_data = extract_static_content(response.content, max_links=10, max_paragraphs=5)
             
             self.logger.info(f"BeautifulSoup: Found {len(scraped_data['links'])} links, {len(scraped_data['paragraphs'])} paragraphs")
             
             # Convert to our standard format
-            return self.convert_beautifulsoup_data(scraped_data)
+            converted = self.convert_beautifulsoup_data(scraped_data, source_url=url)
+            self.emit_records(converted)
+            return converted
             
         except Exception as e:
             self.logger.error(f"BeautifulSoup scraping failed: {e}")
             return {}
     
-    def run_actual_selenium_scraper(self):
+    def run_beautifulsoup_crawl(self, seed_urls, max_concurrency=64, per_host_limit=8, follow_links=False, max_pages=None):
+        """
+        Crawl many static pages concurrently with the async crawler
+        Each page goes through the same extraction and conversion as
+        run_actual_beautifulsoup_scraper(), and the results are merged
+        """
+        self.logger.info(f"Crawling {len(seed_urls)} seed URLs with BeautifulSoup...")
+        
+        with AsyncCrawler(
+            max_concurrency=max_concurrency,
+            per_host_limit=per_host_limit,
+            extract=lambda html: extract_static_content(html, max_links=10, max_paragraphs=5),
+            follow_links=follow_links,
+            max_pages=max_pages,
+            archive=None if self.replay is not None else self.archive,
+            replay=self.replay
+        ) as crawler:
+            results = crawler.run(seed_urls)
+        
+        combined = {
+            'quotes': [],
+            'products': [],
+            'content': []
+        }
+        
+        for result in results:
+            if result['error']:
+                continue
+            
+            converted = self.convert_beautifulsoup_data(result['data'], source_url=result['url'])
+            self.emit_records(converted)
+            for key in combined:
+                combined[key].extend(converted[key])
+        
+        self.logger.info(f"BeautifulSoup crawl: {len(combined['quotes'])} quotes, {len(combined['content'])} content items")
+        
+        return combined
+    
+    def run_actual_selenium_scraper(self, sites=None):
         """
         Actually calls EXISTING Selenium scraper
         This uses the DynamicContentScraper class from selenium_practice.py
+        sites: optional list of site dicts (default: the two practice sites)
         """
         self.logger.info("Calling ACTUAL Selenium scraper...")
         
         try:
-            # This is using ACTUAL Selenium class
-            scraper = DynamicContentScraper()
-            
             # Use existing methods
-            practice_urls = [
-                {
-                    'name': 'Infinite Scroll Practice',
-                    'url': 'https://quotes.toscrape.com/scroll',
-                    'type': 'infinite_scroll'
-                },
-                {
-                    'name': 'AJAX Content Practice', 
-                    'url': 'https://webscraper.io/test-sites/e-commerce/ajax',
-                    'type': 'ajax'
-                }
-            ]
+            practice_urls = sites or PRACTICE_SITES
             
             all_results = []
             
-            for site in practice_urls:
-                self.logger.info(f"Scraping: {site['name']}")
-                
-                if site['type'] == 'infinite_scroll':
-                    content = scraper.scrape_infinite_scroll_site(site['url'])
-                else:
-                    content = scraper.scrape_ajax_site(site['url'])
-                
-                for item in content:
-                    item['source_url'] = site['url']
-                    item['site_name'] = site['name']
-                
-                all_results.extend(content)
-                time.sleep(2)
+            def collect(pool):
+                # Handle each site as soon as its browser is done, streaming its records out
+                futures = {pool.submit(site): site for site in practice_urls}
+                for future in as_completed(futures):
+                    site = futures[future]
+                    try:
+                        content = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Selenium job failed for {site['url']}: {e}")
+                        content = []
+                    
+                    self.logger.info(f"Scraped: {site['name']} ({len(content)} items)")
+                    
+                    for item in content:
+                        item['source_url'] = site['url']
+                        item['site_name'] = site['name']
+                    
+                    self.emit_records(self.convert_selenium_data(content))
+                    all_results.extend(content)
             
-            scraper.close()
+            # Each site runs on its own warm headless DynamicContentScraper
+            if self.selenium_pool is not None:
+                # Long-running mode: browsers stay up between runs
+                collect(self.selenium_pool)
+            else:
+                pool_size = min(self.selenium_pool_size, len(practice_urls))
+                # In replay mode the browsers load captured pages from local stand-in servers
+                replay_server = ReplayServer(self.replay) if self.replay is not None else None
+                try:
+                    with SeleniumDriverPool(size=pool_size, max_pages_per_driver=self.max_pages_per_driver,
+                                            dedup_store=self.dedup_store,
+                                            archive=None if replay_server else self.archive,
+                                            replay=replay_server) as pool:
+                        collect(pool)
+                finally:
+                    if replay_server:
+                        replay_server.close()
             
             self.logger.info(f"Selenium: Collected {len(all_results)} items")
             
@@ -190,7 +347,34 @@ class TrueCombinedPipeline:
             self.logger.error(f"Selenium scraping failed: {e}")
             return {}
     
-    def convert_beautifulsoup_data(self, data):
+    def start_selenium_pool(self, size=None):
+        """
+        Start a driver pool that stays up across runs (used by the scheduler)
+        Later Selenium phases reuse its warm browsers instead of launching Chrome each time
+        size: number of browsers (default selenium_pool_size)
+        """
+        if self.selenium_pool is None:
+            if self.replay is not None:
+                self.replay_server = ReplayServer(self.replay)
+            self.selenium_pool = SeleniumDriverPool(
+                size=size or self.selenium_pool_size,
+                max_pages_per_driver=self.max_pages_per_driver,
+                dedup_store=self.dedup_store,
+                archive=None if self.replay_server else self.archive,
+                replay=self.replay_server
+            ).start()
+        return self.selenium_pool
+    
+    def close(self):
+        """Shut down the long-lived driver pool and replay server, if any"""
+        if self.selenium_pool is not None:
+            self.selenium_pool.close()
+            self.selenium_pool = None
+        if self.replay_server is not None:
+            self.replay_server.close()
+            self.replay_server = None
+    
+    def convert_beautifulsoup_data(self, data, source_url='https://www.passiton.com/inspirational-quotes/'):
         """
         Convert BeautifulSoup data to standard format
         """
@@ -207,7 +391,7 @@ class TrueCombinedPipeline:
                 'author': 'Various',
                 'tags': 'inspirational',
                 'page_number': 1,  # FIXED: Changed 'page' to 'page_number'
-                'source_url': 'https://www.passiton.com/inspirational-quotes/',
+                'source_url': source_url,
                 'scraper_type': 'beautifulsoup'
             })
         
@@ -216,7 +400,7 @@ class TrueCombinedPipeline:
             converted['content'].append({
                 'content_type': 'page_title',
                 'content_text': data['page_title'],  # FIXED: Changed 'content' to 'content_text'
-                'source_url': 'https://www.passiton.com/inspirational-quotes/',
+                'source_url': source_url,
                 'content_length': len(data['page_title']),
                 'word_count': len(data['page_title'].split()),
                 'scraper_type': 'beautifulsoup'
@@ -258,6 +442,34 @@ class TrueCombinedPipeline:
         
         return converted
     
+    def emit_records(self, converted):
+        """Stream converted records to the writer thread while a streaming run is active"""
+        if self.writer is None:
+            return
+        self.writer.emit_many('quotes_new', converted.get('quotes', []))
+        self.writer.emit_many('general_content_new', converted.get('content', []))
+    
+    def write_records(self, table_name, records):
+        """
+        Upsert a batch of converted records into a pipeline table
+        Used by save_combined_data() and as the StreamingWriter's batch writer
+        """
+        # Runs on this thread's connection - the writer thread and scheduled jobs write from their own threads
+        with self.connections.write() as conn:
+            written = PIPELINE_WRITERS[table_name].write(conn, records)
+        
+        # Committed - only now may later runs skip these Selenium items (see drop_seen_content)
+        if self.dedup_store is not None:
+            self.dedup_store.record_content(
+                (
+                    (record.get('quote_text') or record.get('content_text'), record.get('source_url', ''))
+                    for record in records if record.get('scraper_type') == 'selenium'
+                ),
+                namespace='scraped'
+            )
+        
+        return written
+    
     def save_combined_data(self, beautifulsoup_data, selenium_data):
         """
         Save data from both scrapers to database
@@ -271,21 +483,10 @@ class TrueCombinedPipeline:
         
         # Save to database
         if all_quotes:
-            df_quotes = pd.DataFrame(all_quotes)
-            # Use correct column names that match database schema
-            df_quotes = df_quotes.rename(columns={
-                'text': 'quote_text',  # Ensure column names match
-                'page': 'page_number'
-            })
-            df_quotes.to_sql('quotes_new', self.conn, if_exists='append', index=False)
+            self.write_records('quotes_new', all_quotes)
         
         if all_content:
-            df_content = pd.DataFrame(all_content)
-            df_content = df_content.rename(columns={
-                'content': 'content_text',  # Ensure column names match
-                'type': 'content_type'
-            })
-            df_content.to_sql('general_content_new', self.conn, if_exists='append', index=False)
+            self.write_records('general_content_new', all_content)
         
         self.logger.info(f"Saved: {len(all_quotes)} quotes, {len(all_content)} content items")
         
@@ -301,14 +502,34 @@ class TrueCombinedPipeline:
         """
         self.logger.info("STARTING TRUE COMBINED PIPELINE")
         
-        # Phase 1: Run actual BeautifulSoup scraper
-        beautifulsoup_data = self.run_actual_beautifulsoup_scraper()
+        # Phase 3 runs alongside the scrapers: they emit records as they extract them
+        # and a writer thread batches them into SQLite, so finished work is stored
+        # even if a later phase crashes
+        # The writer thread's connection is closed when it exits, so scheduled runs don't pile them up
+        with StreamingWriter(self.write_records, on_exit=self.connections.release) as writer:
+            self.writer = writer
+            try:
+                # Phases 1 and 2: BeautifulSoup and Selenium share nothing, so run them
+                # concurrently - wall-clock time is the slower phase, not the sum
+                phase_data = StageExecutor(max_workers=2).run({
+                    'beautifulsoup': self.run_actual_beautifulsoup_scraper,
+                    'selenium': self.run_actual_selenium_scraper
+                })
+            finally:
+                self.writer = None
+        
+        if writer.failed:
+            self.logger.error(f"Records that could not be written: {writer.failed}")
         
-        # Phase 2: Run actual Selenium scraper
-        selenium_data = self.run_actual_selenium_scraper()
+        beautifulsoup_data = phase_data['beautifulsoup']
+        selenium_data = phase_data['selenium']
         
-        # Phase 3: Combine and save data
-        results = self.save_combined_data(beautifulsoup_data, selenium_data)
+        results = {
+            'total_quotes': writer.written.get('quotes_new', 0),
+            'total_content': writer.written.get('general_content_new', 0),
+            'total_products': len(beautifulsoup_data.get('products', [])) + len(selenium_data.get('products', []))
+        }
+        self.logger.info(f"Saved: {results['total_quotes']} quotes, {results['total_content']} content items")
         
         # Phase 4: Generate report
         self.generate_true_combined_report(results, beautifulsoup_data, selenium_data)
@@ -337,9 +558,129 @@ class TrueCombinedPipeline:
         print(f"   Products: {len(selenium_data.get('products', []))}")
         print("="*70)
 
-def main():
+class PipelineScheduler:
+    """
+    Long-running scheduler that re-runs each source on its own interval
+    One warm TrueCombinedPipeline (database connection, HTTP cache, driver pool)
+    serves every run, so recurring crawls skip all startup cost.
+    Intervals are jittered, and a source that is still running when its
+    next run comes due is skipped instead of overlapping itself.
+    """
+    
+    def __init__(self, pipeline, sources=None, max_workers=2):
+        self.pipeline = pipeline
+        self.sources = sources or SCHEDULED_SOURCES
+        self.logger = logging.getLogger(__name__)
+        
+        # Private scheduler so nothing else registered with schedule's default one runs here
+        self.scheduler = schedule.Scheduler()
+        # Jobs run off the scheduling thread, so a slow Selenium crawl doesn't delay other sources
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pipeline-job')
+        self.running = {source['name']: threading.Lock() for source in self.sources}
+        self.stopped = threading.Event()
+        
+        for source in self.sources:
+            self.add_source(source)
+    
+    def add_source(self, source):
+        """
+        Register a source's recurring job with its jittered interval
+        every_minutes: minutes or a (low, high) range; fractions are allowed
+        """
+        every_minutes = source['every_minutes']
+        if isinstance(every_minutes, (int, float)):
+            every_minutes = (every_minutes, every_minutes)
+        low, high = every_minutes
+        
+        # schedule draws the jitter with randrange, so its bounds must be integers - use whole seconds
+        low_seconds = max(1, round(low * 60))
+        high_seconds = max(low_seconds, round(high * 60))
+        
+        job = self.scheduler.every(low_seconds)
+        if high_seconds > low_seconds:
+            job = job.to(high_seconds)
+        job.seconds.do(self.submit, source).tag(source['name'])
+        
+        self.logger.info(f"Scheduled {source['name']} every {low}-{high} minutes")
+    
+    def submit(self, source):
+        """Hand a due source to the worker threads, unless its previous run is still going"""
+        lock = self.running.setdefault(source['name'], threading.Lock())
+        if not lock.acquire(blocking=False):
+            self.logger.warning(f"{source['name']} is still running - skipping this run")
+            return
+        
+        self.executor.submit(self._run_and_release, source, lock)
+    
+    def _run_and_release(self, source, lock):
+        try:
+            self.run_source(source)
+        except Exception as e:
+            self.logger.error(f"Scheduled run of {source['name']} failed: {e}")
+        finally:
+            lock.release()
+    
+    def run_source(self, source):
+        """Scrape one source with the warm pipeline and save the results"""
+        start_time = time.time()
+        self.logger.info(f"Scheduled run: {source['name']}")
+        
+        if source['kind'] == 'static':
+            beautifulsoup_data = self.pipeline.run_actual_beautifulsoup_scraper(source['url'])
+            selenium_data = {}
+        else:
+            beautifulsoup_data = {}
+            selenium_data = self.pipeline.run_actual_selenium_scraper([source['site']])
+        
+        results = self.pipeline.save_combined_data(beautifulsoup_data, selenium_data)
+        self.logger.info(f"Finished {source['name']} in {time.time() - start_time:.1f}s: {results}")
+        return results
+    
+    def run_forever(self, run_immediately=True, poll_interval=1.0):
+        """
+        Run until stop() is called or Ctrl+C
+        run_immediately: start every source once right away instead of waiting a full interval
+        """
+        # One warm browser per Selenium source is enough - each job scrapes a single site
+        selenium_sources = sum(1 for source in self.sources if source['kind'] == 'selenium')
+        if selenium_sources:
+            self.pipeline.start_selenium_pool(size=min(self.pipeline.selenium_pool_size, selenium_sources))
+        
+        if run_immediately:
+            for source in self.sources:
+                self.submit(source)
+        
+        self.logger.info(f"Scheduler running with {len(self.sources)} sources")
+        
+        try:
+            while not self.stopped.is_set():
+                self.scheduler.run_pending()
+                
+                # Sleep until the next job is due, but wake up regularly to notice stop()
+                idle_seconds = self.scheduler.idle_seconds
+                if idle_seconds is None:
+                    idle_seconds = poll_interval
+                self.stopped.wait(max(0.0, min(poll_interval, idle_seconds)))
+        except KeyboardInterrupt:
+            self.logger.info("Scheduler interrupted")
+        finally:
+            self.shutdown()
+    
+    def stop(self):
+        """Ask run_forever() to return after the current tick"""
+        self.stopped.set()
+    
+    def shutdown(self):
+        """Wait for running jobs, then release the browsers"""
+        self.scheduler.clear()
+        self.executor.shutdown(wait=True)
+        self.pipeline.close()
+        self.logger.info("Scheduler stopped")
+
+def main(daemon=False):
     """
     Run the TRUE combined pipeline
+    daemon: keep running and re-scrape every source on its schedule
     """
     print("TRUE COMBINED Production-PIPELINE - USING ACTUAL SCRAPERS")
     print("="*70)
@@ -350,11 +691,19 @@ def main():
     print("STORES everything in the database")
     print("="*70)
     
-    pipeline = TrueCombinedPipeline()
+    pipeline = TrueCombinedPipeline(http_cache=get_http_cache('http_cache.db'),
+                                    archive=PageArchive('page_archive'))
+    
+    if daemon:
+        print("Running as a scheduler daemon - press Ctrl+C to stop")
+        PipelineScheduler(pipeline).run_forever()
+        return
+    
     pipeline.run_true_combined_pipeline()
     
     print("\nTRUE COMBINED PIPELINE COMPLETED!")
     print("Check 'true_combined_pipeline.log' for detailed execution logs.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # python real_production_pipeline.py --daemon -> recurring scheduled crawls
+    main(daemon='--daemon' in sys.argv)
\ No newline at end of file
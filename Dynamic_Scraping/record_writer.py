@@ -0,0 +1,72 @@
+def as_text(value):
+    """TEXT column: None stays NULL, anything else becomes str"""
+    return None if value is None else str(value)
+
+
+def as_int(value):
+    """INTEGER column: None or unparsable values become NULL"""
+    try:
+        return None if value is None else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RecordWriter:
+    """
+    Typed writer from record dicts straight to one prepared upsert statement
+    Each field is (column, keys, cast, default): the value comes from the first
+    of keys present in the record (so 'text' and 'quote_text' both map to
+    quote_text), is converted with cast, and falls back to default.
+    Rows are generated lazily into executemany - no DataFrame, no intermediate
+    copies and no per-batch type inference.
+    """
+
+    def __init__(self, table_name, fields, conflict_columns=None):
+        self.table_name = table_name
+        self.fields = [
+            (column, (keys,) if isinstance(keys, str) else tuple(keys), cast, default)
+            for column, keys, cast, default in fields
+        ]
+        self.columns = [column for column, _, _, _ in self.fields]
+        self.conflict_columns = tuple(conflict_columns or ())
+        self.sql = self.build_sql()
+
+    def build_sql(self):
+        """INSERT for all columns, upserting on conflict_columns when given"""
+        sql = (
+            f"INSERT INTO {self.table_name} ({', '.join(self.columns)}) "
+            f"VALUES ({', '.join('?' * len(self.columns))})"
+        )
+        if self.conflict_columns:
+            updates = [f'{column} = excluded.{column}' for column in self.columns if column not in self.conflict_columns]
+            updates.append('scrape_timestamp = CURRENT_TIMESTAMP')
+            sql += f" ON CONFLICT({', '.join(self.conflict_columns)}) DO UPDATE SET {', '.join(updates)}"
+        return sql
+
+    def to_row(self, record):
+        """Map one record dict to a parameter tuple in column order"""
+        row = []
+        for column, keys, cast, default in self.fields:
+            value = None
+            for key in keys:
+                if record.get(key) is not None:
+                    value = record[key]
+                    break
+            row.append(cast(value) if value is not None else default)
+        return tuple(row)
+
+    def write(self, conn, records):
+        """
+        executemany the records on conn (the caller owns the transaction)
+        Returns the number of records written
+        """
+        count = 0
+
+        def rows():
+            nonlocal count
+            for record in records:
+                count += 1
+                yield self.to_row(record)
+
+        conn.executemany(self.sql, rows())
+        return count
@@ -0,0 +1,177 @@
+import os
+import mimetypes
+import threading
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, quote
+
+import requests
+
+
+def directory_path(directory, url):
+    """
+    Where a captured URL lives in a replay directory:
+    <directory>/<host>/<path>, with 'index.html' for directory-style paths
+    and the query string appended as '__<quoted query>'
+    """
+    parts = urlsplit(url)
+    path = parts.path.lstrip('/')
+    if not path or path.endswith('/'):
+        path += 'index.html'
+    if parts.query:
+        path += '__' + quote(parts.query, safe='')
+    return os.path.join(directory, parts.netloc, *path.split('/'))
+
+
+class ReplaySource:
+    """
+    Previously captured responses, looked up by URL
+    Reads from a PageArchive (newest snapshot wins) and/or a directory laid
+    out by directory_path(). Nothing ever touches the network.
+    """
+
+    def __init__(self, archive=None, directory=None):
+        if archive is None and directory is None:
+            raise ValueError("ReplaySource needs an archive or a directory")
+        self.archive = archive
+        self.directory = directory
+        self.logger = logging.getLogger(__name__)
+
+    def lookup(self, url):
+        """Return (body bytes, content type) for url, or None if it was never captured"""
+        if self.directory is not None:
+            path = directory_path(self.directory, url)
+            if os.path.isfile(path):
+                with open(path, 'rb') as captured:
+                    return captured.read(), mimetypes.guess_type(path)[0] or 'text/html'
+
+        if self.archive is not None:
+            snapshot = self.archive.latest(url)
+            if snapshot:
+                return self.archive.load(snapshot['digest'], snapshot['codec']), 'text/html'
+
+        self.logger.debug(f"No captured response for {url}")
+        return None
+
+    def capture(self, url, body):
+        """Save a body into the replay directory (for building fixtures by hand)"""
+        if self.directory is None:
+            raise ValueError("capture() needs a replay directory")
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        path = directory_path(self.directory, url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as captured:
+            captured.write(body)
+        return path
+
+    def response(self, url):
+        """
+        Build a requests.Response for url from the captured body
+        Missing URLs get a 404, so raise_for_status() behaves like it would live
+        """
+        response = requests.Response()
+        response.url = url
+        response.encoding = 'utf-8'
+
+        found = self.lookup(url)
+        if found is None:
+            response.status_code = 404
+            response.reason = 'Not Captured'
+            response._content = b''
+        else:
+            body, content_type = found
+            response.status_code = 200
+            response.reason = 'OK'
+            response.headers['Content-Type'] = content_type
+            response._content = body
+
+        return response
+
+
+class ReplayServer:
+    """
+    Local HTTP stand-in that lets Selenium load captured pages
+    One server (port) is started per original origin, so paths - and the
+    relative links inside replayed pages - map one to one onto the original site.
+    url_for() turns an original URL into its local address; original_url()
+    maps the browser's current URL back.
+    """
+
+    def __init__(self, source, host='127.0.0.1'):
+        self.source = source
+        self.host = host
+        self.logger = logging.getLogger(__name__)
+
+        self._servers = {}   # origin -> (server, thread)
+        self._origins = {}   # local origin -> original origin
+        self._lock = threading.Lock()
+
+    def _handler_for(self, origin):
+        source = self.source
+        logger = self.logger
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                found = source.lookup(origin + self.path)
+                if found is None:
+                    self.send_error(404, 'Not Captured')
+                    return
+
+                body, content_type = found
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"replay {origin}: {format % args}")
+
+        return ReplayHandler
+
+    def _local_origin(self, origin):
+        """Start (once) the server for an original origin and return its local origin"""
+        with self._lock:
+            if origin not in self._servers:
+                server = ThreadingHTTPServer((self.host, 0), self._handler_for(origin))
+                server.daemon_threads = True
+                thread = threading.Thread(target=server.serve_forever, name=f'replay-{server.server_port}', daemon=True)
+                thread.start()
+
+                self._servers[origin] = (server, thread)
+                self._origins[f'http://{self.host}:{server.server_port}'] = origin
+                self.logger.info(f"Replaying {origin} on port {server.server_port}")
+
+            server, _ = self._servers[origin]
+            return f'http://{self.host}:{server.server_port}'
+
+    def url_for(self, url):
+        """Local replay address of an original URL"""
+        parts = urlsplit(url)
+        local_origin = self._local_origin(f'{parts.scheme}://{parts.netloc}')
+        return local_origin + url[len(f'{parts.scheme}://{parts.netloc}'):]
+
+    def original_url(self, local_url):
+        """Map a local replay URL back to the original; other URLs pass through"""
+        parts = urlsplit(local_url)
+        origin = self._origins.get(f'{parts.scheme}://{parts.netloc}')
+        if origin is None:
+            return local_url
+        return origin + local_url[len(f'{parts.scheme}://{parts.netloc}'):]
+
+    def close(self):
+        """Stop every replay server"""
+        with self._lock:
+            for server, thread in self._servers.values():
+                server.shutdown()
+                server.server_close()
+            self._servers = {}
+            self._origins = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
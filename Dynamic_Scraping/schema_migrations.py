@@ -0,0 +1,106 @@
+import logging
+
+# Versioned, non-destructive schema upgrades for the SQLite databases.
+# Each component (ScrapingDatabase, the pipeline tables, ...) owns an ordered
+# list of (version, description, step) where step(cursor) is idempotent.
+# schema_version remembers how far each component got, so a long-lived
+# database only runs the steps it hasn't seen yet - nothing is dropped.
+
+
+def ensure_version_tables(cursor):
+    """Create schema_version (current version per component) and its history log"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            component TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS schema_migration_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            component TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            description TEXT,
+            applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+
+def get_schema_version(cursor, component):
+    """Current schema version of a component (0 if it was never migrated)"""
+    ensure_version_tables(cursor)
+    row = cursor.execute('SELECT version FROM schema_version WHERE component = ?', (component,)).fetchone()
+    return row[0] if row else 0
+
+
+def apply_migrations(cursor, component, migrations, logger=None):
+    """
+    Run the migrations of a component that are newer than its recorded version
+    migrations: [(version, description, step(cursor))] in ascending version order.
+    Run it inside one transaction (e.g. ConnectionManager.write()) so a failing
+    step leaves the database at its previous version.
+    Returns the list of versions applied
+    """
+    logger = logger or logging.getLogger(__name__)
+    current = get_schema_version(cursor, component)
+    applied = []
+
+    for version, description, step in migrations:
+        if version <= current:
+            continue
+
+        logger.info(f"Migrating {component} to v{version}: {description}")
+        step(cursor)
+
+        cursor.execute('''
+            INSERT INTO schema_version (component, version) VALUES (?, ?)
+            ON CONFLICT(component) DO UPDATE SET version = excluded.version, updated_at = CURRENT_TIMESTAMP
+        ''', (component, version))
+        cursor.execute(
+            'INSERT INTO schema_migration_log (component, version, description) VALUES (?, ?, ?)',
+            (component, version, description)
+        )
+        applied.append(version)
+
+    if applied:
+        logger.info(f"{component} schema is now v{applied[-1]}")
+    return applied
+
+
+def object_exists(cursor, object_type, name):
+    """True if sqlite_master has a table/index/trigger with this name"""
+    return cursor.execute(
+        'SELECT 1 FROM sqlite_master WHERE type = ? AND name = ?', (object_type, name)
+    ).fetchone() is not None
+
+
+def column_exists(cursor, table_name, column):
+    """True if table_name has a column with this name"""
+    return any(row[1] == column for row in cursor.execute(f'PRAGMA table_info({table_name})'))
+
+
+def add_column_if_missing(cursor, table_name, column, declaration):
+    """ALTER TABLE ... ADD COLUMN unless the column is already there; returns True if added"""
+    if column_exists(cursor, table_name, column):
+        return False
+    cursor.execute(f'ALTER TABLE {table_name} ADD COLUMN {column} {declaration}')
+    return True
+
+
+def add_unique_key(cursor, index_name, table_name, columns):
+    """
+    Create a UNIQUE index on columns, first collapsing duplicate rows (keeping the newest id)
+    Returns the number of duplicate rows removed
+    """
+    if object_exists(cursor, 'index', index_name):
+        return 0
+
+    key_columns = ', '.join(columns)
+    cursor.execute(f'''
+        DELETE FROM {table_name}
+        WHERE id NOT IN (SELECT MAX(id) FROM {table_name} GROUP BY {key_columns})
+    ''')
+    removed = cursor.rowcount
+    cursor.execute(f'CREATE UNIQUE INDEX {index_name} ON {table_name} ({key_columns})')
+    return removed
@@ -0,0 +1,136 @@
+import threading
+import time
+
+# Tables whose row counts are kept in table_counters
+COUNTED_TABLES = ('quotes', 'products', 'general_content')
+
+
+def install_stat_triggers(cursor):
+    """
+    Create the running-counter tables and the triggers that maintain them
+    table_counters holds one row count per data table and quote_author_counts
+    one count per author, so stats never need COUNT(*) or GROUP BY scans.
+    Counters are backfilled from the existing rows the first time.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS table_counters (
+            table_name TEXT PRIMARY KEY,
+            row_count INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS quote_author_counts (
+            author TEXT PRIMARY KEY,
+            quote_count INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_quote_author_counts_count ON quote_author_counts (quote_count)')
+
+    already_installed = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_quotes_count_insert'"
+    ).fetchone()
+
+    if not already_installed:
+        # One-off backfill, in the same transaction as the trigger creation
+        for table_name in COUNTED_TABLES:
+            cursor.execute(
+                f'INSERT OR REPLACE INTO table_counters (table_name, row_count) SELECT ?, COUNT(*) FROM {table_name}',
+                (table_name,)
+            )
+        cursor.execute('DELETE FROM quote_author_counts')
+        cursor.execute('''
+            INSERT INTO quote_author_counts (author, quote_count)
+            SELECT author, COUNT(*) FROM quotes GROUP BY author
+        ''')
+
+    for table_name in COUNTED_TABLES:
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_{table_name}_count_insert AFTER INSERT ON {table_name}
+            BEGIN
+                UPDATE table_counters SET row_count = row_count + 1 WHERE table_name = '{table_name}';
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_{table_name}_count_delete AFTER DELETE ON {table_name}
+            BEGIN
+                UPDATE table_counters SET row_count = row_count - 1 WHERE table_name = '{table_name}';
+            END
+        ''')
+
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_quotes_author_insert AFTER INSERT ON quotes
+        BEGIN
+            INSERT INTO quote_author_counts (author, quote_count) VALUES (NEW.author, 1)
+            ON CONFLICT(author) DO UPDATE SET quote_count = quote_count + 1;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_quotes_author_delete AFTER DELETE ON quotes
+        BEGIN
+            UPDATE quote_author_counts SET quote_count = quote_count - 1 WHERE author = OLD.author;
+            DELETE FROM quote_author_counts WHERE author = OLD.author AND quote_count <= 0;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_quotes_author_update AFTER UPDATE OF author ON quotes
+        WHEN NEW.author IS NOT OLD.author
+        BEGIN
+            UPDATE quote_author_counts SET quote_count = quote_count - 1 WHERE author = OLD.author;
+            DELETE FROM quote_author_counts WHERE author = OLD.author AND quote_count <= 0;
+            INSERT INTO quote_author_counts (author, quote_count) VALUES (NEW.author, 1)
+            ON CONFLICT(author) DO UPDATE SET quote_count = quote_count + 1;
+        END
+    ''')
+
+
+class ScrapingStats:
+    """
+    Cheap, cached stats summary built from the trigger-maintained counters
+    The summary is recomputed at most once per ttl seconds, so dashboards
+    can poll as often as they like.
+    """
+
+    def __init__(self, connections, ttl=30):
+        self.connections = connections
+        self.ttl = ttl
+        self._summary = None
+        self._computed_at = 0.0
+        self._lock = threading.Lock()
+
+    def summary(self, force_refresh=False):
+        """
+        Return {'total_quotes', 'total_products', 'total_content',
+        'top_authors': [(author, count)], 'recent_sessions': (columns, rows)}
+        """
+        with self._lock:
+            expired = time.time() - self._computed_at >= self.ttl
+            if force_refresh or self._summary is None or expired:
+                self._summary = self.compute()
+                self._computed_at = time.time()
+            return self._summary
+
+    def invalidate(self):
+        """Drop the cached summary so the next call recomputes it"""
+        with self._lock:
+            self._summary = None
+
+    def compute(self):
+        """Read the counters - a handful of primary-key and index lookups"""
+        conn = self.connections.connection()
+
+        counts = dict(conn.execute('SELECT table_name, row_count FROM table_counters').fetchall())
+        top_authors = conn.execute(
+            'SELECT author, quote_count FROM quote_author_counts ORDER BY quote_count DESC LIMIT 5'
+        ).fetchall()
+
+        cursor = conn.execute('SELECT * FROM scraping_sessions ORDER BY start_time DESC LIMIT 3')
+        session_columns = [description[0] for description in cursor.description]
+        recent_sessions = cursor.fetchall()
+
+        return {
+            'total_quotes': counts.get('quotes', 0),
+            'total_products': counts.get('products', 0),
+            'total_content': counts.get('general_content', 0),
+            'top_authors': top_authors,
+            'recent_sessions': (session_columns, recent_sessions)
+        }
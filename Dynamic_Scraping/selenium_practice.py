@@ -4,15 +4,71 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
 import pandas as pd
 import time
 import os
 
+from readiness import PageReadiness
+from dedup_store import content_fingerprint
+from page_parsers import parse_page_content
+
+# Extracts only elements not seen by a previous call, and marks them as seen.
+# Returns [type, text] pairs in the same order as get_page_content()
+NEW_CONTENT_JS = """
+var marker = 'data-scraped';
+var listBudget = arguments[0];
+var results = [];
+
+function collect(selector, type, minLength, limit) {
+    var nodes = document.querySelectorAll(selector);
+    for (var i = 0; i < nodes.length; i++) {
+        var node = nodes[i];
+        if (node.hasAttribute(marker)) continue;
+        node.setAttribute(marker, '1');
+        if (limit !== null && limit <= 0) continue;
+        var text = (node.textContent || '').trim();
+        if (text && text.length > minLength) {
+            results.push([type, text]);
+        }
+        if (limit !== null) limit -= 1;
+    }
+    return limit;
+}
+
+collect('p', 'paragraph', 5, null);
+collect('h1, h2, h3, h4, h5, h6', 'heading', 0, null);
+var remaining = collect('li', 'list_item', 3, listBudget);
+return [results, remaining];
+"""
+
+# Serialises the DOM like page_source, but from a copy without the data-scraped
+# markers - an archived snapshot must replay as a fresh page, or incremental
+# extraction would skip every element in it
+CLEAN_PAGE_SOURCE_JS = """
+var root = document.documentElement.cloneNode(true);
+var marked = root.querySelectorAll('[data-scraped]');
+for (var i = 0; i < marked.length; i++) {
+    marked[i].removeAttribute('data-scraped');
+}
+var doctype = document.doctype ? '<!DOCTYPE ' + document.doctype.name + '>' : '';
+return doctype + root.outerHTML;
+"""
+
 class DynamicContentScraper:
-    def __init__(self):
-        """Initialize the Selenium scraper"""
+    def __init__(self, headless=False, dedup_store=None, archive=None, replay=None):
+        """
+        Initialize the Selenium scraper
+        dedup_store: optional persistent DedupStore; content seen in earlier runs is skipped
+        archive: optional PageArchive; the rendered page_source of every scraped page is kept
+        replay: optional ReplayServer; pages are loaded from captured copies instead of the live site
+        """
         self.driver = None
+        self.readiness = None
+        self.headless = headless
+        self.dedup_store = dedup_store
+        self.archive = archive
+        self.replay = replay
+        self.list_item_budget = 20
         self.setup_driver()
         
     def setup_driver(self):
@@ -21,8 +77,9 @@ class DynamicContentScraper:
         
         chrome_options = Options()
         
-        # Uncomment the next line if you want to run in background (headless)
-        # chrome_options.add_argument("--headless")  
+        # Run in background (headless) - used by the parallel driver pool
+        if self.headless:
+            chrome_options.add_argument("--headless=new")
         
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -31,6 +88,7 @@ class DynamicContentScraper:
         try:
         # This often works without specifying path
               self.driver = webdriver.Chrome(options=chrome_options)
+              self.readiness = PageReadiness(self.driver)
               print("Chrome driver setup successfully!")
         except Exception as e:
               print(f"Error: {e}")
@@ -45,32 +103,46 @@ class DynamicContentScraper:
         #     print("Please download chromedriver from: https://chromedriver.chromium.org/")
         #     print(" Place chromedriver.exe in your project folder")
     
-    def scrape_infinite_scroll_site(self, url):
+    def scrape_infinite_scroll_site(self, url, ready_selector=None, incremental=True):
         """
         Scrape a website with infinite scroll
         This is perfect for practice - content loads as you scroll
+        ready_selector: optional site-specific CSS selector that marks loaded content
+        incremental: only extract elements added since the previous scroll
         """
         print(f"Scraping infinite scroll site: {url}")
         
         try:
             # Navigate to page
-            self.driver.get(url)
+            self.driver.get(self.resolve_url(url))
             
             # Wait for page to load
             wait = WebDriverWait(self.driver, 10)
             wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             
+            # <body> exists before dynamic content arrives - wait for the page to settle
+            self.readiness.wait_until_settled(selector=ready_selector, timeout=10)
+            
             # Let's see what's initially loaded
-            initial_content = self.get_page_content()
+            if incremental:
+                self.list_item_budget = 20
+                initial_content = self.get_new_page_content()
+            else:
+                initial_content = self.get_page_content()
             print(f"Initial content items: {len(initial_content)}")
             
             # Now let's scroll to load more content
             print("Starting to scroll...")
-            additional_content = self.scroll_and_collect()
+            additional_content = self.scroll_and_collect(incremental=incremental)
             
             # Combine all content
             all_content = initial_content + additional_content
             
+            # Keep the fully scrolled DOM for later re-extraction
+            self.archive_page_source(url)
+            
+            all_content = self.drop_seen_content(all_content, url)
+            
             print(f"Total content collected: {len(all_content)} items")
             return all_content
             
@@ -80,37 +152,24 @@ class DynamicContentScraper:
     
     def get_page_content(self):
         """Get current page content"""
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        
-        # Extract various elements that might contain data
-        content = []
-        
-        # Get all paragraphs
-        paragraphs = soup.find_all('p')
-        for p in paragraphs:
-            text = p.get_text().strip()
-            if text and len(text) > 5:
-                content.append({'type': 'paragraph', 'content': text})
-        
-        # Get all headings
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        for h in headings:
-            text = h.get_text().strip()
-            if text:
-                content.append({'type': 'heading', 'content': text})
-        
-        # Get all list items
-        list_items = soup.find_all('li')
-        for li in list_items[:20]:  # Limit to avoid too much data
-            text = li.get_text().strip()
-            if text and len(text) > 3:
-                content.append({'type': 'list_item', 'content': text})
-        
-        return content
+        return parse_page_content(self.driver.page_source, list_item_limit=20)
+    
+    def get_new_page_content(self):
+        """
+        Get only the content added since the last call
+        Runs in the page and tags visited elements with a data-scraped
+        attribute, so nothing is serialised or parsed twice
+        """
+        new_items, self.list_item_budget = self.driver.execute_script(NEW_CONTENT_JS, self.list_item_budget)
+        
+        return [{'type': item_type, 'content': text} for item_type, text in new_items]
     
-    def scroll_and_collect(self, max_scrolls=3):
+    def scroll_and_collect(self, max_scrolls=3, count_selector='body *', scroll_timeout=5, incremental=False):
         """
         Scroll down to load more dynamic content
+        After each scroll, wait until more elements match count_selector and
+        the page is quiet again, instead of sleeping a fixed time
+        incremental: extract only newly added elements instead of re-parsing the whole page
         """
         print(f"Scrolling {max_scrolls} times to load dynamic content...")
         
@@ -119,38 +178,84 @@ class DynamicContentScraper:
         for scroll in range(max_scrolls):
             print(f"   Scroll {scroll + 1}/{max_scrolls}")
             
+            previous_count = self.readiness.count_elements(count_selector)
+            
             # Scroll to bottom
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             
             # Wait for new content to load
-            time.sleep(2)
+            settled = self.readiness.wait_until_settled(
+                count_selector=count_selector,
+                previous_count=previous_count,
+                timeout=scroll_timeout
+            )
             
             # Get new content that loaded after scroll
-            new_content = self.get_page_content()
+            if incremental:
+                new_content = self.get_new_page_content()
+            else:
+                new_content = self.get_page_content()
             all_additional_content.extend(new_content)
             
-            print(f"   Found {len(new_content)} new items")
+            print(f"   Found {len(new_content)} new items (settled in {settled['elapsed']:.2f}s)")
+            
+            # Nothing new appeared - we reached the end of the feed
+            if self.readiness.count_elements(count_selector) <= previous_count:
+                print("   No more content loaded, stopping scroll")
+                break
         
-        # Remove duplicates
+        # Remove duplicates (stable fingerprints, not per-process hash() values)
         unique_content = []
         seen_content = set()
         
         for item in all_additional_content:
-            content_hash = hash(item['content'])
-            if content_hash not in seen_content:
-                seen_content.add(content_hash)
+            fingerprint = content_fingerprint(item['content'])
+            if fingerprint not in seen_content:
+                seen_content.add(fingerprint)
                 unique_content.append(item)
         
         return unique_content
     
-    def scrape_ajax_site(self, url):
+    def resolve_url(self, url):
+        """Address the browser should load for url (the local replay copy in replay mode)"""
+        return self.replay.url_for(url) if self.replay is not None else url
+    
+    def archive_page_source(self, url):
+        """Store the current rendered DOM, minus our data-scraped markers, in the page archive (if one is set)"""
+        if self.archive is None:
+            return None
+        
+        try:
+            return self.archive.store(url, self.driver.execute_script(CLEAN_PAGE_SOURCE_JS), source='selenium')
+        except Exception as e:
+            print(f"Could not archive page source for {url}: {e}")
+            return None
+    
+    def drop_seen_content(self, content, url):
+        """
+        Drop items stored from this URL in an earlier run (needs a dedup_store)
+        Only checks - TrueCombinedPipeline.write_records() records the items under
+        'scraped' once they are committed
+        """
+        if self.dedup_store is None:
+            return content
+        
+        is_new = self.dedup_store.unseen_content(((item['content'], url) for item in content), namespace='scraped')
+        skipped = len(content) - sum(is_new)
+        if skipped:
+            print(f"Skipped {skipped} items already scraped in earlier runs")
+        
+        return [item for item, new in zip(content, is_new) if new]
+    
+    def scrape_ajax_site(self, url, ready_selector=None):
         """
         Scrape a site that loads content via AJAX after initial load
+        ready_selector: optional site-specific CSS selector that marks loaded content
         """
         print(f"🔄 Scraping AJAX site: {url}")
         
         try:
-            self.driver.get(url)
+            self.driver.get(self.resolve_url(url))
             
             # Wait longer for AJAX content to load
             wait = WebDriverWait(self.driver, 15)
@@ -158,10 +263,12 @@ class DynamicContentScraper:
             # Wait for specific elements that indicate content is loaded
             wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             
-            # Sometimes we need to wait for specific loading indicators to disappear
-            time.sleep(3)
+            # Wait for the AJAX requests to finish and the DOM to stop changing
+            settled = self.readiness.wait_until_settled(selector=ready_selector, timeout=15)
+            print(f"Page settled in {settled['elapsed']:.2f}s")
             
-            content = self.get_page_content()
+            self.archive_page_source(url)
+            content = self.drop_seen_content(self.get_page_content(), url)
             print(f"AJAX content collected: {len(content)} items")
             
             return content
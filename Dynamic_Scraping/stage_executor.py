@@ -0,0 +1,49 @@
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+
+class StageExecutor:
+    """
+    Run independent pipeline stages concurrently and hand back results as they finish
+    Threads by default - scraper phases mostly wait on the network and on
+    Chrome, and can share the pipeline object. use_processes=True runs stages
+    in worker processes instead; their callables and results must be picklable
+    (top-level functions, not bound methods of objects holding connections).
+    """
+
+    def __init__(self, max_workers=None, use_processes=False):
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, stages, on_result=None, default=None):
+        """
+        Run {name: callable} concurrently and return {name: result}
+        on_result(name, result) is called in the calling thread as each stage
+        completes, so results can be merged or saved while slower stages still run.
+        A stage that raises is logged and yields default (a fresh {} if not given).
+        """
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        max_workers = self.max_workers or len(stages) or 1
+        start_time = time.time()
+        results = {}
+
+        with executor_class(max_workers=max_workers) as executor:
+            futures = {executor.submit(stage): name for name, stage in stages.items()}
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error(f"Stage {name} failed: {e}")
+                    result = {} if default is None else default
+
+                self.logger.info(f"Stage {name} finished after {time.time() - start_time:.2f}s")
+                results[name] = result
+                if on_result is not None:
+                    on_result(name, result)
+
+        self.logger.info(f"All {len(stages)} stages finished in {time.time() - start_time:.2f}s")
+        return results
@@ -0,0 +1,38 @@
+from bs4 import BeautifulSoup
+
+
+def extract_static_content(html, max_links=15, max_paragraphs=5, parser='html.parser'):
+    """
+    Extract page title, links and paragraphs from a static HTML page
+    This is the extraction logic shared by enhanced_scraper(),
+    the pipeline's BeautifulSoup phase and the async crawler
+    """
+    soup = BeautifulSoup(html, parser)
+    scraped_data = {}
+
+    # Extract page title
+    page_title = soup.find('title')
+    if page_title:
+        scraped_data['page_title'] = page_title.get_text().strip()
+
+    # Extract links
+    links = soup.find_all('a', href=True)
+    scraped_data['links'] = []
+
+    for link in links[:max_links]:
+        link_data = {
+            'text': link.get_text().strip()[:50],  # Limit text length
+            'url': link['href']
+        }
+        scraped_data['links'].append(link_data)
+
+    # Extract paragraphs
+    paragraphs = soup.find_all('p')
+    scraped_data['paragraphs'] = []
+
+    for para in paragraphs[:max_paragraphs]:
+        text = para.get_text().strip()
+        if text and len(text) > 10:  # Only meaningful paragraphs
+            scraped_data['paragraphs'].append(text[:200])  # Limit length
+
+    return scraped_data
@@ -0,0 +1,138 @@
+import time
+import queue
+import threading
+import logging
+
+# Queue control messages
+_STOP = object()
+_FLUSH = object()
+
+
+class StreamingWriter:
+    """
+    Bounded producer/consumer queue between the scrapers and the database
+    Scrapers emit() records as soon as they are extracted; one writer thread
+    groups them per table and hands batches to write_batch(table, records).
+    A batch is written when it reaches batch_size or has waited flush_interval
+    seconds, so data shows up early and a late crash loses at most one batch.
+    The queue holds at most max_queue records - producers block when the
+    writer falls behind, which caps memory.
+    on_exit() is called in the writer thread just before it ends, e.g. to
+    release the per-thread database connection write_batch opened.
+    """
+
+    def __init__(self, write_batch, batch_size=500, flush_interval=1.0, max_queue=10000, on_exit=None):
+        self.write_batch = write_batch
+        self.on_exit = on_exit
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.logger = logging.getLogger(__name__)
+
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.emitted = {}   # table -> records received
+        self.written = {}   # table -> records written
+        self.failed = {}    # table -> records whose batch raised
+        self._counts_lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Start the writer thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._writer_loop, name='streaming-writer', daemon=True)
+            self._thread.start()
+        return self
+
+    def emit(self, table_name, record):
+        """Queue one record for table_name (blocks while the queue is full)"""
+        self.queue.put((table_name, record))
+        with self._counts_lock:
+            self.emitted[table_name] = self.emitted.get(table_name, 0) + 1
+
+    def emit_many(self, table_name, records):
+        """Queue several records for table_name"""
+        for record in records:
+            self.emit(table_name, record)
+
+    def flush(self, timeout=None):
+        """Block until everything emitted so far has been written"""
+        done = threading.Event()
+        self.queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def close(self):
+        """Write what is left and stop the writer thread"""
+        if self._thread is not None:
+            self.queue.put((_STOP, None))
+            self._thread.join()
+            self._thread = None
+
+    def _write(self, pending):
+        """Write every pending batch and clear it"""
+        for table_name, records in pending.items():
+            if not records:
+                continue
+            try:
+                self.write_batch(table_name, records)
+                with self._counts_lock:
+                    self.written[table_name] = self.written.get(table_name, 0) + len(records)
+                self.logger.debug(f"Wrote {len(records)} records to {table_name}")
+            except Exception as e:
+                # Keep consuming - one bad batch shouldn't stall the producers
+                with self._counts_lock:
+                    self.failed[table_name] = self.failed.get(table_name, 0) + len(records)
+                self.logger.error(f"Writing {len(records)} records to {table_name} failed: {e}")
+        pending.clear()
+
+    def _writer_loop(self):
+        try:
+            self._consume()
+        finally:
+            if self.on_exit is not None:
+                try:
+                    self.on_exit()
+                except Exception as e:
+                    self.logger.warning(f"Writer exit hook failed: {e}")
+
+    def _consume(self):
+        pending = {}
+        oldest = None  # when the oldest pending record arrived
+
+        while True:
+            timeout = None
+            if oldest is not None:
+                timeout = max(0.0, self.flush_interval - (time.time() - oldest))
+
+            try:
+                table_name, record = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                # Pending records waited flush_interval - write them now
+                self._write(pending)
+                oldest = None
+                continue
+
+            if table_name is _STOP:
+                self._write(pending)
+                break
+
+            if table_name is _FLUSH:
+                self._write(pending)
+                oldest = None
+                record.set()
+                continue
+
+            batch = pending.setdefault(table_name, [])
+            batch.append(record)
+            if oldest is None:
+                oldest = time.time()
+
+            if len(batch) >= self.batch_size:
+                self._write({table_name: batch})
+                pending.pop(table_name)
+                if not pending:
+                    oldest = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,108 @@
+import csv
+import gzip
+import json
+
+# Supported export formats and their default file extensions
+EXPORT_FORMATS = {
+    'csv': '.csv',
+    'csv.gz': '.csv.gz',
+    'jsonl': '.jsonl',
+    'parquet': '.parquet'
+}
+
+
+def get_table_columns(conn, table_name):
+    """Return [(column name, declared type)] for a table, or raise ValueError if it doesn't exist"""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+    ).fetchone()
+    if not exists:
+        raise ValueError(f"Unknown table: {table_name}")
+
+    return [(row[1], (row[2] or '').upper()) for row in conn.execute(f'PRAGMA table_info({table_name})')]
+
+
+def iter_table_chunks(conn, table_name, chunk_size=10000):
+    """Yield lists of row tuples from a table, chunk_size rows at a time"""
+    cursor = conn.execute(f'SELECT * FROM {table_name}')
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield rows
+
+
+def export_table(conn, table_name, filename, fmt='csv', chunk_size=10000):
+    """
+    Stream a whole table to a file without loading it into memory
+    Rows are read with a cursor chunk_size at a time and written out
+    immediately, so memory stays bounded by one chunk.
+    Returns the number of rows written
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt} (choose from {', '.join(EXPORT_FORMATS)})")
+
+    columns = get_table_columns(conn, table_name)
+    column_names = [name for name, _ in columns]
+    chunks = iter_table_chunks(conn, table_name, chunk_size)
+
+    if fmt == 'parquet':
+        return write_parquet(chunks, columns, filename)
+
+    if fmt == 'csv.gz':
+        output = gzip.open(filename, 'wt', newline='', encoding='utf-8')
+    else:
+        output = open(filename, 'w', newline='', encoding='utf-8')
+
+    total_rows = 0
+    with output:
+        if fmt == 'jsonl':
+            for rows in chunks:
+                output.writelines(
+                    json.dumps(dict(zip(column_names, row)), ensure_ascii=False, default=str) + '\n'
+                    for row in rows
+                )
+                total_rows += len(rows)
+        else:
+            writer = csv.writer(output)
+            writer.writerow(column_names)
+            for rows in chunks:
+                writer.writerows(rows)
+                total_rows += len(rows)
+
+    return total_rows
+
+
+def write_parquet(chunks, columns, filename):
+    """Write row chunks to Parquet, one row group per chunk (needs pyarrow)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export needs pyarrow: pip install pyarrow")
+
+    def arrow_type(declared_type):
+        # Follow SQLite's type affinity rules
+        if 'INT' in declared_type or declared_type == 'BOOLEAN':
+            return pa.int64()
+        if any(name in declared_type for name in ('REAL', 'FLOA', 'DOUB')):
+            return pa.float64()
+        return pa.string()
+
+    schema = pa.schema([(name, arrow_type(declared_type)) for name, declared_type in columns])
+    column_names = [name for name, _ in columns]
+
+    total_rows = 0
+    with pq.ParquetWriter(filename, schema) as writer:
+        for rows in chunks:
+            arrays = []
+            for i, field in enumerate(schema):
+                values = [row[i] for row in rows]
+                if field.type == pa.string():
+                    # SQLite columns are loosely typed - stringify stray numbers
+                    values = [value if value is None or isinstance(value, str) else str(value) for value in values]
+                arrays.append(pa.array(values, type=field.type))
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, names=column_names))
+            total_rows += len(rows)
+
+    return total_rows
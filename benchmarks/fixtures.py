@@ -0,0 +1,163 @@
+import os
+import random
+
+# Synthetic fixtures shaped like the practice sites the scrapers target
+# (quotes.toscrape.com listings, webscraper.io product grids, generic articles).
+# A fixed seed keeps every run byte-for-byte identical.
+
+# Number of repeated blocks per fixture size
+SIZES = {
+    'small': 10,
+    'medium': 100,
+    'large': 1000
+}
+
+WORDS = (
+    'life love world change think dream hope truth light time mind heart courage '
+    'freedom wisdom friend success failure happiness journey moment future simple'
+).split()
+
+AUTHORS = ['Albert Einstein', 'J.K. Rowling', 'Jane Austen', 'Marilyn Monroe', 'Mark Twain', 'Dr. Seuss']
+
+
+def _sentence(rng, min_words=6, max_words=24):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))).capitalize() + '.'
+
+
+def _page(title, body):
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8">'
+        f'<title>{title}</title><script src="/static/app.js"></script></head>'
+        '<body><div class="container"><div class="header-box row"><h1><a href="/">'
+        f'{title}</a></h1></div>{body}'
+        '<footer class="footer"><p class="text-muted">Quotes by: GoodReads.com</p></footer>'
+        '</div></body></html>'
+    )
+
+
+def quotes_page(count, seed=0):
+    """Listing page with count quote blocks (div.quote / span.text / small.author / a.tag)"""
+    rng = random.Random(seed)
+    blocks = []
+    for _ in range(count):
+        tags = ''.join(f'<a class="tag" href="/tag/{tag}/">{tag}</a>' for tag in rng.sample(WORDS, 3))
+        blocks.append(
+            '<div class="quote" itemscope itemtype="http://schema.org/CreativeWork">'
+            f'<span class="text" itemprop="text">“{_sentence(rng)}”</span>'
+            f'<span>by <small class="author" itemprop="author">{rng.choice(AUTHORS)}</small>'
+            '<a href="/author/x">(about)</a></span>'
+            f'<div class="tags">Tags: {tags}</div></div>'
+        )
+    pager = '<nav><ul class="pager"><li class="next"><a href="/page/2/">Next</a></li></ul></nav>'
+    return _page('Quotes to Scrape', '<div class="col-md-8">' + ''.join(blocks) + pager + '</div>')
+
+
+def products_page(count, seed=0):
+    """E-commerce grid with count product cards (div.thumbnail / h4 / p.description)"""
+    rng = random.Random(seed)
+    cards = []
+    for i in range(count):
+        cards.append(
+            '<div class="col-md-4 col-lg-4"><div class="card thumbnail"><div class="caption">'
+            f'<h4 class="price float-end">${rng.randint(10, 1500)}.{rng.randint(0, 99):02d}</h4>'
+            f'<h4><a href="/product/{i}" class="title">{" ".join(rng.sample(WORDS, 3)).title()}</a></h4>'
+            f'<p class="description card-text">{_sentence(rng)}</p></div>'
+            f'<div class="ratings"><p class="review-count">{rng.randint(0, 15)} reviews</p></div>'
+            '</div></div>'
+        )
+    return _page('E-commerce training site', '<div class="row">' + ''.join(cards) + '</div>')
+
+
+def content_page(count, seed=0):
+    """Article-style page with count sections of headings, paragraphs and list items"""
+    rng = random.Random(seed)
+    sections = []
+    for i in range(count):
+        items = ''.join(f'<li>{_sentence(rng, 2, 6)}</li>' for _ in range(3))
+        sections.append(
+            f'<h2>Section {i} {rng.choice(WORDS)}</h2>'
+            f'<p>{_sentence(rng)}</p><p>{_sentence(rng)}</p><ul>{items}</ul>'
+        )
+    return _page('Infinite Scroll Practice', ''.join(sections))
+
+
+def scraped_rows(count, seed=0):
+    """Rows shaped like scraped_data.csv (Data Type, Content), with noise and duplicates to clean"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        kind = rng.choice(['Page Title', ' link ', 'Link', 'paragraph 1', None])
+        if kind == 'Link' or kind == ' link ':
+            content = f"{_sentence(rng, 1, 4)} -> https://www.example.com/{rng.choice(WORDS)}"
+        else:
+            content = f"  {_sentence(rng)}  ❤ #{i % 50}!!  "
+        if rng.random() < 0.05:
+            content = None
+        rows.append({'Data Type': kind, 'Content': content})
+    return rows
+
+
+def quote_records(count, seed=0):
+    """Quote dicts as produced by extract_page_data(), for the storage benchmarks"""
+    rng = random.Random(seed)
+    return [
+        {
+            'text': f'{_sentence(rng)} #{i}',
+            'author': rng.choice(AUTHORS),
+            'tags': ', '.join(rng.sample(WORDS, 3)),
+            'page': i // 10 + 1,
+            'source_url': 'https://quotes.toscrape.com/'
+        }
+        for i in range(count)
+    ]
+
+
+def product_records(count, seed=0):
+    """Product dicts as produced by scrape_ecommerce_site()"""
+    rng = random.Random(seed)
+    return [
+        {
+            'name': f'{" ".join(rng.sample(WORDS, 3)).title()} {i}',
+            'price': f'${rng.randint(10, 1500)}.99',
+            'description': _sentence(rng),
+            'source_url': 'https://webscraper.io/test-sites/e-commerce/allinone'
+        }
+        for i in range(count)
+    ]
+
+
+def content_records(count, seed=0):
+    """General content dicts as produced by get_page_content()"""
+    rng = random.Random(seed)
+    return [
+        {
+            'type': rng.choice(['paragraph', 'heading', 'list_item']),
+            'content': f'{_sentence(rng)} #{i}',
+            'source_url': 'https://quotes.toscrape.com/scroll'
+        }
+        for i in range(count)
+    ]
+
+
+def load_recorded_pages(path):
+    """
+    Recorded HTML fixtures as [(name, html bytes)]
+    path is either a PageArchive root (newest snapshot per URL)
+    or a directory of captured .html files
+    """
+    if os.path.isfile(os.path.join(path, 'index.db')):
+        from page_archive import PageArchive
+
+        archive = PageArchive(path)
+        try:
+            return [(snapshot['url'], body) for snapshot, body in archive.iter_pages(latest_only=True)]
+        finally:
+            archive.close()
+
+    pages = []
+    for root, _, files in os.walk(path):
+        for filename in sorted(files):
+            if filename.endswith(('.html', '.htm')):
+                with open(os.path.join(root, filename), 'rb') as page:
+                    pages.append((os.path.relpath(os.path.join(root, filename), path), page.read()))
+    return pages
@@ -0,0 +1,119 @@
+import gc
+import json
+import math
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(name, func, setup=None, teardown=None, items=1, repeat=7, warmup=1, track_memory=True):
+    """
+    Time func over repeat runs and report latency, throughput and peak memory
+    setup() runs untimed before every call and its return value is passed to func;
+    teardown(state) runs untimed after. items is the number of records/pages one
+    call processes, used for throughput. Peak memory comes from one extra
+    tracemalloc run, so tracing overhead never skews the timings.
+    """
+    def run_once():
+        state = setup() if setup else None
+        gc.collect()
+        start = time.perf_counter()
+        func(state) if setup else func()
+        elapsed = time.perf_counter() - start
+        if teardown:
+            teardown(state)
+        return elapsed
+
+    for _ in range(warmup):
+        run_once()
+
+    timings = [run_once() for _ in range(repeat)]
+
+    peak_bytes = None
+    if track_memory:
+        state = setup() if setup else None
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(state) if setup else func()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            if teardown:
+                teardown(state)
+
+    p50 = percentile(timings, 50)
+    return {
+        'name': name,
+        'items': items,
+        'runs': repeat,
+        'p50_ms': round(p50 * 1000, 3),
+        'p99_ms': round(percentile(timings, 99) * 1000, 3),
+        'mean_ms': round(sum(timings) / len(timings) * 1000, 3),
+        'min_ms': round(min(timings) * 1000, 3),
+        'throughput_per_s': round(items / p50, 1) if p50 > 0 else None,
+        'peak_mb': round(peak_bytes / 1024 / 1024, 3) if peak_bytes is not None else None
+    }
+
+
+def format_results(results):
+    """Fixed-width table of benchmark results"""
+    header = f"{'benchmark':<44} {'items':>7} {'p50 ms':>10} {'p99 ms':>10} {'items/s':>12} {'peak MB':>9}"
+    lines = [header, '-' * len(header)]
+    for result in results:
+        peak = f"{result['peak_mb']:.2f}" if result['peak_mb'] is not None else '-'
+        throughput = f"{result['throughput_per_s']:,.0f}" if result['throughput_per_s'] else '-'
+        lines.append(
+            f"{result['name']:<44} {result['items']:>7} {result['p50_ms']:>10.2f} "
+            f"{result['p99_ms']:>10.2f} {throughput:>12} {peak:>9}"
+        )
+    return '\n'.join(lines)
+
+
+def save_baseline(results, filename):
+    """Write results (plus machine info) as a baseline JSON file"""
+    baseline = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.platform(),
+        'results': {result['name']: result for result in results}
+    }
+    with open(filename, 'w', encoding='utf-8') as output:
+        json.dump(baseline, output, indent=2)
+    return baseline
+
+
+def load_baseline(filename):
+    """Read a baseline JSON file written by save_baseline()"""
+    with open(filename, encoding='utf-8') as baseline_file:
+        return json.load(baseline_file)
+
+
+def compare_to_baseline(results, baseline, tolerance=0.2):
+    """
+    Return a list of regression messages (empty when everything is within tolerance)
+    A benchmark regresses when its p50 latency or peak memory grows by more than
+    tolerance (0.2 = 20%) over the baseline. Benchmarks missing from the baseline are skipped.
+    """
+    regressions = []
+    for result in results:
+        previous = baseline['results'].get(result['name'])
+        if not previous:
+            continue
+
+        for metric in ('p50_ms', 'peak_mb'):
+            old, new = previous.get(metric), result.get(metric)
+            if old and new is not None and new > old * (1 + tolerance):
+                regressions.append(
+                    f"{result['name']}: {metric} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)"
+                )
+
+    return regressions
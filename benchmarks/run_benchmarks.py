@@ -0,0 +1,232 @@
+"""
+Benchmarks for the extraction, cleaning and storage hot paths
+
+    python benchmarks/run_benchmarks.py                       # run and print
+    python benchmarks/run_benchmarks.py --save-baseline main  # write benchmarks/baselines/main.json
+    python benchmarks/run_benchmarks.py --compare main        # exit 1 on a >20% regression
+    python benchmarks/run_benchmarks.py --recorded page_archive --sizes small
+
+Parsing is benchmarked on page source through the pure parsers behind
+get_page_content(), extract_page_data() and scrape_ecommerce_site(),
+so no browser is needed.
+"""
+import argparse
+import contextlib
+import io
+import logging
+import os
+import shutil
+import sys
+import tempfile
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.append(PROJECT_DIR)
+sys.path.append(os.path.join(PROJECT_DIR, 'Dynamic_Scraping'))
+
+# Configure logging before ScrapingDatabase does, so its INFO lines
+# (and log file) stay out of the measurements
+logging.basicConfig(level=logging.WARNING)
+
+import fixtures
+from harness import measure, format_results, save_baseline, load_baseline, compare_to_baseline
+
+DEFAULT_BASELINE_DIR = os.path.join(BENCHMARK_DIR, 'baselines')
+
+# Rows/records per size for the DataFrame and database benchmarks
+RECORDS_PER_BLOCK = 100
+
+
+def parsing_benchmarks(sizes):
+    """(name, kwargs for measure()) for the three page parsers on synthetic pages"""
+    from page_parsers import parse_page_content, parse_page_data, parse_products
+
+    cases = []
+    for size in sizes:
+        count = fixtures.SIZES[size]
+
+        html = fixtures.content_page(count)
+        cases.append((f'get_page_content[{size}]', dict(
+            func=lambda html=html: parse_page_content(html), items=1)))
+
+        html = fixtures.quotes_page(count)
+        cases.append((f'extract_page_data[{size}]', dict(
+            func=lambda html=html: parse_page_data(html, 1, 'https://quotes.toscrape.com/'), items=1)))
+
+        html = fixtures.products_page(count)
+        cases.append((f'scrape_ecommerce_site.parse[{size}]', dict(
+            func=lambda html=html: parse_products(html, 'https://webscraper.io/test-sites/e-commerce/allinone'),
+            items=1)))
+
+    return cases
+
+
+def recorded_benchmarks(path):
+    """The same parsers over every recorded page (one call = all pages)"""
+    from page_parsers import parse_page_content, parse_page_data, parse_products
+
+    pages = fixtures.load_recorded_pages(path)
+    if not pages:
+        print(f"No recorded pages found in {path}")
+        return []
+
+    def run_all(parse):
+        for name, html in pages:
+            parse(name, html)
+
+    return [
+        ('recorded.get_page_content', dict(
+            func=lambda: run_all(lambda name, html: parse_page_content(html)), items=len(pages))),
+        ('recorded.extract_page_data', dict(
+            func=lambda: run_all(lambda name, html: parse_page_data(html, 1, name)), items=len(pages))),
+        ('recorded.scrape_ecommerce_site.parse', dict(
+            func=lambda: run_all(lambda name, html: parse_products(html, name)), items=len(pages)))
+    ]
+
+
+def cleaning_benchmarks(sizes):
+    """clean_dataframe() on scraped_data.csv-shaped frames"""
+    import pandas as pd
+    from data_cleaning import clean_dataframe
+
+    cases = []
+    for size in sizes:
+        rows = fixtures.SIZES[size] * RECORDS_PER_BLOCK
+        df = pd.DataFrame(fixtures.scraped_rows(rows))
+
+        def clean(df=df):
+            # clean_dataframe reports progress with print()
+            with contextlib.redirect_stdout(io.StringIO()):
+                clean_dataframe(df)
+
+        cases.append((f'clean_dataframe[{size}]', dict(func=clean, items=rows)))
+
+    return cases
+
+
+def storage_benchmarks(sizes, work_dir):
+    """Each ScrapingDatabase.save_* into a fresh database, and export_to_csv of a filled one"""
+    from database_scraper_fixed import ScrapingDatabase
+
+    def fresh_database():
+        handle, db_name = tempfile.mkstemp(suffix='.db', dir=work_dir)
+        os.close(handle)
+        return ScrapingDatabase(db_name=db_name)
+
+    def drop_database(db):
+        db.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db.db_name + suffix):
+                os.remove(db.db_name + suffix)
+
+    def checked(save, records):
+        # save_* log and return 0 on errors - make a broken write path fail loudly instead
+        def run(db):
+            written = save(db, records)
+            if written != len(records):
+                raise RuntimeError(f"Expected {len(records)} rows written, got {written}")
+        return run
+
+    cases = []
+    for size in sizes:
+        count = fixtures.SIZES[size] * RECORDS_PER_BLOCK
+        savers = [
+            ('save_quotes', ScrapingDatabase.save_quotes, fixtures.quote_records(count)),
+            ('save_products', ScrapingDatabase.save_products, fixtures.product_records(count)),
+            ('save_general_content', ScrapingDatabase.save_general_content, fixtures.content_records(count))
+        ]
+        for name, save, records in savers:
+            cases.append((f'{name}[{size}]', dict(
+                func=checked(save, records), setup=fresh_database, teardown=drop_database, items=count)))
+
+        # One database filled up front; each run exports it to a new file
+        filled = fresh_database()
+        filled.save_quotes(fixtures.quote_records(count))
+        export_file = os.path.join(work_dir, f'quotes_export_{size}.csv')
+
+        def export(db=filled, filename=export_file):
+            if db.export_to_csv('quotes', filename) is None:
+                raise RuntimeError("export_to_csv failed")
+
+        cases.append((f'export_to_csv[{size}]', dict(func=export, items=count)))
+
+    return cases
+
+
+def run_benchmarks(groups, sizes, repeat=7, name_filter=None, recorded=None):
+    """Build and run the selected benchmark groups, returning a list of result dicts"""
+    work_dir = tempfile.mkdtemp(prefix='scraping_bench_')
+    results = []
+
+    try:
+        cases = []
+        if 'parsing' in groups:
+            cases += parsing_benchmarks(sizes)
+            if recorded:
+                cases += recorded_benchmarks(recorded)
+        if 'cleaning' in groups:
+            cases += cleaning_benchmarks(sizes)
+        if 'storage' in groups:
+            cases += storage_benchmarks(sizes, work_dir)
+
+        for name, kwargs in cases:
+            if name_filter and name_filter not in name:
+                continue
+            print(f"Running {name}...", flush=True)
+            results.append(measure(name, repeat=repeat, **kwargs))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extraction, cleaning and storage hot paths")
+    parser.add_argument('--groups', default='parsing,cleaning,storage',
+                        help="comma-separated groups: parsing, cleaning, storage")
+    parser.add_argument('--sizes', default='small,medium,large',
+                        help=f"comma-separated fixture sizes: {', '.join(fixtures.SIZES)}")
+    parser.add_argument('--repeat', type=int, default=7, help="timed runs per benchmark")
+    parser.add_argument('--filter', dest='name_filter', help="only run benchmarks whose name contains this")
+    parser.add_argument('--recorded', help="PageArchive root or directory of .html files to parse as well")
+    parser.add_argument('--baseline-dir', default=DEFAULT_BASELINE_DIR)
+    parser.add_argument('--save-baseline', metavar='NAME', help="save results as <baseline-dir>/NAME.json")
+    parser.add_argument('--compare', metavar='NAME', help="compare against <baseline-dir>/NAME.json")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed slowdown before failing (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    sizes = [size for size in args.sizes.split(',') if size]
+    unknown = [size for size in sizes if size not in fixtures.SIZES]
+    if unknown:
+        parser.error(f"Unknown sizes: {', '.join(unknown)}")
+
+    results = run_benchmarks(
+        groups=args.groups.split(','),
+        sizes=sizes,
+        repeat=args.repeat,
+        name_filter=args.name_filter,
+        recorded=args.recorded
+    )
+
+    print()
+    print(format_results(results))
+
+    if args.save_baseline:
+        os.makedirs(args.baseline_dir, exist_ok=True)
+        filename = os.path.join(args.baseline_dir, f'{args.save_baseline}.json')
+        save_baseline(results, filename)
+        print(f"\nBaseline saved to {filename}")
+
+    if args.compare:
+        baseline = load_baseline(os.path.join(args.baseline_dir, f'{args.compare}.json'))
+        regressions = compare_to_baseline(results, baseline, tolerance=args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against baseline '{args.compare}':")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nNo regressions against baseline '{args.compare}' (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,26 @@
-import pandas as pd
-import numpy as np
 import re
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
-# CRITICAL FIX: Force matplotlib to use non-GUI backend
-import matplotlib
-matplotlib.use('Agg')  # This completely avoids Tcl/Tk
-import matplotlib.pyplot as plt
-import seaborn as sns
+# Importing this module does no I/O and no heavy imports, so the cleaning
+# functions can be used as a library by workers that start in milliseconds.
+# The few functions that call pandas/numpy directly import them locally
+# (the rest only use methods of the DataFrame they are given), and
+# matplotlib is only imported inside visualize_data()
 
-# Display more rows and columns in output
-pd.set_option('display.max_rows', 100)
-pd.set_option('display.max_columns', 50)
-pd.set_option('display.width', 1000)
+# Characters removed from Content: anything except word chars, whitespace and basic punctuation
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\.\,\!\?\-\>]')
+# Runs of whitespace collapsed to a single space
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def configure_display():
+    """Display more rows and columns in output (only when run as a script)"""
+    import pandas as pd
+    
+    pd.set_option('display.max_rows', 100)
+    pd.set_option('display.max_columns', 50)
+    pd.set_option('display.width', 1000)
 
 def load_and_explore_data(filename='scraped_data.csv'):
     """
@@ -20,6 +28,8 @@ def load_and_explore_data(filename='scraped_data.csv'):
     """
     print("Loading and exploring the data...")
     
+    import pandas as pd
+    
     # Load the CSV file
     df = pd.read_csv(filename)
     
@@ -39,13 +49,13 @@ def load_and_explore_data(filename='scraped_data.csv'):
     
     return df
 
-# Let's run the exploration
-df = load_and_explore_data()
-
 #data cleaning functions
-def clean_dataframe(df):
+def clean_dataframe(df, string_storage=None, dedup_store=None):
     """
     Main data cleaning function that applies various cleaning operations
+    string_storage: optional pandas string backend for Content ('python' or 'pyarrow')
+    dedup_store: optional persistent DedupStore, also drops rows exported in earlier runs
+    (pass the same store to export_cleaned_data, which records the rows it writes)
     """
     print("\n Starting data cleaning process...")
     
@@ -61,13 +71,13 @@ def clean_dataframe(df):
     cleaned_df = clean_data_type_column(cleaned_df)
     
     # 3. Clean the 'Content' column
-    cleaned_df = clean_content_column(cleaned_df)
+    cleaned_df = clean_content_column(cleaned_df, string_storage=string_storage)
     
     # 4. Handle missing values
     cleaned_df = handle_missing_values(cleaned_df)
     
     # 5. Remove duplicates
-    cleaned_df = remove_duplicates(cleaned_df)
+    cleaned_df = remove_duplicates(cleaned_df, dedup_store=dedup_store)
     
     # 6. Extract additional features
     cleaned_df = extract_features(cleaned_df)
@@ -89,18 +99,34 @@ def clean_data_type_column(df):
     print(f" Unique data types: {df['Data Type'].unique()}")
     return df
 
-def clean_content_column(df):
-    """Clean the Content column"""
+def clean_content_column(df, string_storage=None):
+    """
+    Clean the Content column in one chained pass of vectorized string methods
+    string_storage: None keeps the column as-is, 'python' or 'pyarrow' converts
+    it to that pandas string dtype first ('pyarrow' runs the regexes in Arrow's
+    C++ kernels; note its \\w only matches ASCII letters)
+    """
     print(" Cleaning Content column...")
     
-    # Remove extra whitespace
-    df['Content'] = df['Content'].str.strip()
-    
-    # Remove special characters but keep basic punctuation
-    df['Content'] = df['Content'].apply(lambda x: re.sub(r'[^\w\s\.\,\!\?\-\>]', '', str(x)) if pd.notna(x) else x)
-    
-    # Replace multiple spaces with single space
-    df['Content'] = df['Content'].str.replace(r'\s+', ' ', regex=True)
+    content = df['Content']
+    if string_storage:
+        import pandas as pd
+        content = content.astype(pd.StringDtype(string_storage))
+        # Arrow only uses its native kernels for plain string patterns
+        special_chars, whitespace = SPECIAL_CHARS_PATTERN.pattern, WHITESPACE_PATTERN.pattern
+    else:
+        # Non-null values are cleaned as strings (numbers included), NaN stays NaN
+        content = content.where(content.isna(), content.astype(str))
+        special_chars, whitespace = SPECIAL_CHARS_PATTERN, WHITESPACE_PATTERN
+    
+    # Remove special characters but keep basic punctuation,
+    # replace multiple spaces with single space, then trim
+    df['Content'] = (
+        content
+        .str.replace(special_chars, '', regex=True)
+        .str.replace(whitespace, ' ', regex=True)
+        .str.strip()
+    )
     
     return df
 
@@ -118,12 +144,24 @@ def handle_missing_values(df):
     
     return df
 
-def remove_duplicates(df):
-    """Remove duplicate entries"""
+def remove_duplicates(df, dedup_store=None):
+    """
+    Remove duplicate entries
+    With a DedupStore, rows exported in earlier runs are dropped as well
+    (only checked here - export_cleaned_data records them once they are written)
+    """
     print("Removing duplicates...")
     
     initial_count = len(df)
     df = df.drop_duplicates(subset=['Data Type', 'Content'], keep='first')
+    
+    if dedup_store is not None:
+        import numpy as np
+        
+        is_new = dedup_store.unseen_content(zip(df['Content'], df['Data Type']), namespace='cleaned')
+        # Boolean array, not a list: df[[]] would select zero columns on an empty frame
+        df = df.loc[np.asarray(is_new, dtype=bool)]
+    
     final_count = len(df)
     
     print(f" Removed {initial_count - final_count} duplicate rows")
@@ -180,6 +218,11 @@ def visualize_data(df, type_distribution):
     """
     print("\n Creating visualizations...")
     
+    # CRITICAL FIX: Force matplotlib to use non-GUI backend
+    import matplotlib
+    matplotlib.use('Agg')  # This completely avoids Tcl/Tk
+    import matplotlib.pyplot as plt
+    
     # Set up the plotting style
     plt.style.use('default')
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
@@ -218,12 +261,16 @@ def visualize_data(df, type_distribution):
     """
     #Export the cleaned data to a new CSV file
     """
-def export_cleaned_data(df, filename='cleaned_scraped_data.csv'):
+def export_cleaned_data(df, filename='cleaned_scraped_data.csv', dedup_store=None):
        print(f"\n Exporting cleaned data to {filename}...")
     
        # Export main cleaned data
        df.to_csv(filename, index=False)
     
+       # Written - later runs may now skip these rows
+       if dedup_store is not None:
+           dedup_store.record_content(zip(df['Content'], df['Data Type']), namespace='cleaned')
+    
        # Also create a summary report
        create_summary_report(df, 'data_cleaning_summary.txt')
     
@@ -254,8 +301,107 @@ def create_summary_report(df, filename):
         f.write("-" * 30 + "\n")
         f.write(df.head(10).to_string())
 
+def clean_csv_in_chunks(input_file='scraped_data.csv', output_file='cleaned_scraped_data.csv',
+                        chunksize=50000, string_storage=None, dedup_store=None):
+    """
+    Streaming version of clean_dataframe for CSVs too large to load at once
+    Reads the input chunksize rows at a time, cleans each chunk, drops rows
+    already seen in earlier chunks and appends the result to output_file.
+    Only the 64-bit row hashes used for deduplication are kept between chunks
+    (one sorted uint64 array), or nothing at all when a persistent DedupStore is given.
+    Returns (rows read, rows written)
+    """
+    print(f"\n Streaming clean of {input_file} in chunks of {chunksize} rows...")
+    
+    import numpy as np
+    import pandas as pd
+    
+    seen_hashes = np.empty(0, dtype=np.uint64)
+    rows_read = 0
+    rows_written = 0
+    first_chunk = True
+    
+    # dtypes are inferred per chunk - pin the text columns, or a chunk whose
+    # 'Data Type' is all missing comes back as float64 and breaks .str
+    for chunk in pd.read_csv(input_file, chunksize=chunksize, dtype={'Data Type': object, 'Content': object}):
+        rows_read += len(chunk)
+        
+        chunk = chunk.dropna(how='all')
+        chunk = clean_data_type_column(chunk)
+        chunk = clean_content_column(chunk, string_storage=string_storage)
+        chunk = handle_missing_values(chunk)
+        chunk = extract_features(chunk)
+        
+        # Deduplicate on the same columns as remove_duplicates, across all chunks so far
+        if dedup_store is not None:
+            keep = np.asarray(
+                dedup_store.unseen_content(zip(chunk['Content'], chunk['Data Type']), namespace='cleaned'), dtype=bool
+            )
+        else:
+            row_hashes = pd.util.hash_pandas_object(chunk[['Data Type', 'Content']], index=False)
+            # Repeats within the chunk, then hashes seen in earlier chunks (binary search)
+            keep = ~row_hashes.duplicated().to_numpy()
+            row_hashes = row_hashes.to_numpy()
+            positions = np.searchsorted(seen_hashes, row_hashes).clip(max=max(len(seen_hashes) - 1, 0))
+            if len(seen_hashes):
+                keep &= seen_hashes[positions] != row_hashes
+            # Merge the new hashes in; timsort on two sorted runs is close to linear
+            seen_hashes = np.sort(np.concatenate([seen_hashes, np.sort(row_hashes[keep])]), kind='stable')
+        chunk = chunk.loc[keep]
+        
+        chunk.to_csv(output_file, mode='w' if first_chunk else 'a', header=first_chunk, index=False)
+        if dedup_store is not None:
+            dedup_store.record_content(zip(chunk['Content'], chunk['Data Type']), namespace='cleaned')
+        first_chunk = False
+        rows_written += len(chunk)
+    
+    print(f" Streaming clean finished: {rows_read} rows read, {rows_written} unique rows written to {output_file}")
+    return rows_read, rows_written
+
+def clean_partition(df, string_storage=None):
+    """
+    Run the row-level clean_dataframe stages on one partition
+    Duplicates are removed within the partition here and again globally after merging
+    """
+    df = df.dropna(how='all')
+    df = clean_data_type_column(df)
+    df = clean_content_column(df, string_storage=string_storage)
+    df = handle_missing_values(df)
+    df = remove_duplicates(df)
+    df = extract_features(df)
+    return df
+
+def parallel_clean_dataframe(df, workers=None, min_partition_rows=50000, string_storage=None, dedup_store=None):
+    """
+    Multi-core version of clean_dataframe
+    Splits the frame into one partition per worker process, cleans the partitions
+    in parallel, concatenates them in their original order and runs a final
+    global remove_duplicates pass. Small frames are cleaned in-process.
+    """
+    workers = workers or os.cpu_count() or 1
+    partition_count = min(workers, max(1, len(df) // min_partition_rows))
+    
+    if partition_count <= 1:
+        return clean_dataframe(df, string_storage=string_storage, dedup_store=dedup_store)
+    
+    import pandas as pd
+    
+    print(f"\n Cleaning {len(df)} rows in {partition_count} partitions on {workers} worker processes...")
+    
+    partition_size = -(-len(df) // partition_count)  # ceiling division
+    partitions = [df.iloc[start:start + partition_size].copy() for start in range(0, len(df), partition_size)]
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(partitions))) as executor:
+        cleaned_partitions = list(executor.map(clean_partition, partitions, [string_storage] * len(partitions)))
+    
+    cleaned_df = pd.concat(cleaned_partitions)
+    cleaned_df = remove_duplicates(cleaned_df, dedup_store=dedup_store)
+    
+    print(" Parallel data cleaning completed!")
+    return cleaned_df
+
     #Main Execution
-def main():
+def main(parallel=False):
     #Main function to run the entire data cleaning pipeline
     print(" Starting Data Cleaning Pipeline")
     print("=" * 50)
@@ -264,8 +410,11 @@ def main():
         # Step 1: Load and explore data
         df = load_and_explore_data('scraped_data.csv')
         
-        # Step 2: Clean the data
-        cleaned_df = clean_dataframe(df)
+        # Step 2: Clean the data (optionally across all CPU cores)
+        if parallel:
+            cleaned_df = parallel_clean_dataframe(df)
+        else:
+            cleaned_df = clean_dataframe(df)
         
         # Step 3: Analyze the data
         type_distribution = analyze_data(cleaned_df)
@@ -289,4 +438,11 @@ def main():
         print(f" An error occurred: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    configure_display()
+    
+    # python data_cleaning.py --stream  -> chunked cleaning for large inputs
+    # python data_cleaning.py --parallel -> clean partitions on all CPU cores
+    if '--stream' in sys.argv:
+        clean_csv_in_chunks('scraped_data.csv', 'cleaned_scraped_data.csv')
+    else:
+        main(parallel='--parallel' in sys.argv)
\ No newline at end of file
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Same import layout as the scripts: project root plus Dynamic_Scraping on sys.path
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'Dynamic_Scraping'))
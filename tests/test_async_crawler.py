@@ -0,0 +1,132 @@
+import asyncio
+import time
+import threading
+
+from async_crawler import AsyncCrawler
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeEngine:
+    """Slow responses for slow.example, instant ones for everything else"""
+
+    def __init__(self, slow_delay=0.3):
+        self.slow_delay = slow_delay
+        self.finished = {}
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def fetch(self, url):
+        if 'slow.example' in url:
+            time.sleep(self.slow_delay)
+        with self._lock:
+            self.finished[url] = time.monotonic()
+        return FakeResponse(url)
+
+    def close(self):
+        self.closed = True
+
+
+def test_busy_host_does_not_block_other_hosts():
+    engine = FakeEngine()
+    slow = [f'https://slow.example/{i}' for i in range(4)]
+    fast = [f'https://fast.example/{i}' for i in range(4)]
+
+    crawler = AsyncCrawler(engine=engine, max_concurrency=4, per_host_limit=1, extract=lambda html: {})
+    results = crawler.run(slow + fast)
+
+    assert len(results) == 8
+    assert all(result['error'] is None for result in results)
+    # Every fast page is done before the first slow page returns
+    assert max(engine.finished[url] for url in fast) < min(engine.finished[url] for url in slow)
+
+
+def test_per_host_limit_is_respected():
+    active = {'now': 0, 'peak': 0}
+    lock = threading.Lock()
+
+    class CountingEngine(FakeEngine):
+        def fetch(self, url):
+            with lock:
+                active['now'] += 1
+                active['peak'] = max(active['peak'], active['now'])
+            try:
+                time.sleep(0.02)
+                return FakeResponse(url)
+            finally:
+                with lock:
+                    active['now'] -= 1
+
+    urls = [f'https://one.example/{i}' for i in range(12)]
+    crawler = AsyncCrawler(engine=CountingEngine(), max_concurrency=8, per_host_limit=2, extract=lambda html: {})
+
+    assert len(crawler.run(urls)) == 12
+    assert active['peak'] <= 2
+
+
+def test_close_only_closes_owned_engine():
+    engine = FakeEngine()
+    with AsyncCrawler(engine=engine):
+        pass
+    assert not engine.closed
+
+    crawler = AsyncCrawler()
+    closed = []
+    crawler.engine.close = lambda: closed.append(True)
+    with crawler:
+        pass
+    assert crawler.owns_engine
+    assert closed == [True]
+
+
+def crawl_with_timeout(crawler, seed_urls, timeout=5):
+    """Run a crawl, failing the test instead of hanging if it never finishes"""
+    return asyncio.run(asyncio.wait_for(crawler.crawl(seed_urls), timeout))
+
+
+def test_malformed_links_are_skipped():
+    pages = {
+        'https://site.example/': [{'url': 'http://[bad/'}, {'url': '/next'}],
+        'https://site.example/next': [{'url': 'http://[also-bad/'}]
+    }
+    crawler = AsyncCrawler(engine=FakeEngine(), max_concurrency=3, follow_links=True,
+                           extract=lambda url: {'links': pages.get(url, [])})
+
+    results = crawl_with_timeout(crawler, ['https://site.example/'])
+
+    assert sorted(result['url'] for result in results) == ['https://site.example/', 'https://site.example/next']
+    assert all(result['error'] is None for result in results)
+
+
+def test_link_errors_keep_the_page_result():
+    # A link dict without 'url' raises KeyError while following links
+    pages = {f'https://site.example/{i}': [{'text': 'no url'}] for i in range(3)}
+    crawler = AsyncCrawler(engine=FakeEngine(), max_concurrency=1, follow_links=True,
+                           extract=lambda url: {'links': pages[url]})
+
+    results = crawl_with_timeout(crawler, list(pages))
+
+    assert sorted(result['url'] for result in results) == sorted(pages)
+    assert all(result['error'] is None for result in results)
+
+
+def test_worker_survives_unexpected_errors():
+    urls = [f'https://site.example/{i}' for i in range(4)]
+    crawler = AsyncCrawler(engine=FakeEngine(), max_concurrency=1, extract=lambda url: {})
+    fetch_and_extract = crawler.fetch_and_extract
+
+    def flaky(url):
+        if url.endswith('/1'):
+            raise RuntimeError('boom')
+        return fetch_and_extract(url)
+
+    crawler.fetch_and_extract = flaky
+    results = crawl_with_timeout(crawler, urls)
+
+    errors = {result['url']: result['error'] for result in results}
+    assert sorted(errors) == urls
+    assert errors['https://site.example/1'] == 'boom'
+    assert sum(error is None for error in errors.values()) == 3
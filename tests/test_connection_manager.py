@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from connection_manager import ConnectionManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ConnectionManager(str(tmp_path / 'test.db'))
+    with manager.write() as conn:
+        conn.execute('CREATE TABLE items (name TEXT)')
+    yield manager
+    manager.close()
+
+
+def count_items(manager):
+    # A separate connection sees only committed rows
+    other = ConnectionManager(manager.db_name)
+    try:
+        return other.connection().execute('SELECT COUNT(*) FROM items').fetchone()[0]
+    finally:
+        other.close()
+
+
+def test_write_commits(manager):
+    with manager.write() as conn:
+        conn.execute("INSERT INTO items VALUES ('a')")
+    assert count_items(manager) == 1
+
+
+def test_write_rolls_back_on_error(manager):
+    with pytest.raises(RuntimeError):
+        with manager.write() as conn:
+            conn.execute("INSERT INTO items VALUES ('a')")
+            raise RuntimeError('boom')
+    assert count_items(manager) == 0
+
+
+def test_nested_write_joins_outer_transaction(manager):
+    with manager.write() as outer:
+        outer.execute("INSERT INTO items VALUES ('a')")
+        with manager.write() as inner:
+            inner.execute("INSERT INTO items VALUES ('b')")
+        # Inner block must not commit on its own
+        assert count_items(manager) == 0
+    assert count_items(manager) == 2
+
+
+def test_nested_error_rolls_back_everything(manager):
+    with pytest.raises(RuntimeError):
+        with manager.write() as outer:
+            outer.execute("INSERT INTO items VALUES ('a')")
+            with manager.write() as inner:
+                inner.execute("INSERT INTO items VALUES ('b')")
+                raise RuntimeError('boom')
+    assert count_items(manager) == 0
+
+    # The depth counter is reset, so the next write() is a real transaction again
+    with manager.write() as conn:
+        conn.execute("INSERT INTO items VALUES ('c')")
+    assert count_items(manager) == 1
+
+
+def test_statement_outside_write_does_not_swallow_next_write(manager):
+    # A stray INSERT must not leave an open transaction that write() mistakes for an outer one
+    manager.connection().execute("INSERT INTO items VALUES ('stray')")
+    with manager.write() as conn:
+        conn.execute("INSERT INTO items VALUES ('a')")
+    assert not manager.connection().in_transaction
+    assert count_items(manager) == 2
+
+
+def test_release_closes_only_this_threads_connection(manager):
+    main_conn = manager.connection()
+    opened = {}
+
+    def worker():
+        opened['conn'] = manager.connection()
+        manager.release()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert opened['conn'] not in manager._connections
+    assert manager._connections == [main_conn]
+    # Still usable after another thread released its connection
+    assert main_conn.execute('SELECT COUNT(*) FROM items').fetchone()[0] == 0
+
+    manager.release()
+    assert manager._connections == []
+    # A fresh connection is opened on next use
+    assert manager.connection() is not main_conn
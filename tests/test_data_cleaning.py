@@ -0,0 +1,85 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+from data_cleaning import clean_csv_in_chunks, clean_dataframe
+
+
+def make_rows(count):
+    # Every value appears three times, spread over different chunks
+    return pd.DataFrame({
+        'Data Type': ['quote', 'Quote ', 'paragraph'] * count,
+        'Content': [f'Text  number {i % count}!' for i in range(3 * count)]
+    })
+
+
+def test_chunked_clean_matches_in_memory_clean(tmp_path):
+    df = make_rows(50)
+    input_file = tmp_path / 'scraped.csv'
+    output_file = tmp_path / 'cleaned.csv'
+    df.to_csv(input_file, index=False)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows_read, rows_written = clean_csv_in_chunks(str(input_file), str(output_file), chunksize=7)
+        expected = clean_dataframe(df)
+
+    streamed = pd.read_csv(output_file)
+    assert rows_read == len(df)
+    assert rows_written == len(expected) == len(streamed)
+    assert list(streamed['Content']) == list(expected['Content'])
+    assert not streamed.duplicated(subset=['Data Type', 'Content']).any()
+
+
+
+def test_import_does_not_load_pandas():
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = 'import sys, data_cleaning; print("pandas" in sys.modules)'
+    result = subprocess.run([sys.executable, '-c', code], cwd=project_dir, capture_output=True, text=True)
+    assert result.stdout.strip() == 'False'
+
+
+def test_chunk_with_all_missing_data_type(tmp_path):
+    df = pd.DataFrame({
+        'Data Type': ['quote', 'quote', None, None, 'paragraph'],
+        'Content': ['first text', 'second text', 'third text', 'fourth text', 'fifth text']
+    })
+    input_file = tmp_path / 'scraped.csv'
+    output_file = tmp_path / 'cleaned.csv'
+    df.to_csv(input_file, index=False)
+
+    # The second chunk (rows 3-4) has no Data Type at all
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows_read, rows_written = clean_csv_in_chunks(str(input_file), str(output_file), chunksize=2)
+
+    streamed = pd.read_csv(output_file)
+    assert (rows_read, rows_written) == (5, 5)
+    assert list(streamed['Data Type']) == ['Quote', 'Quote', 'Unknown', 'Unknown', 'Paragraph']
+
+
+def test_dedup_store_on_empty_and_fully_seen_frames(tmp_path, monkeypatch):
+    from dedup_store import DedupStore
+    from data_cleaning import export_cleaned_data, remove_duplicates
+
+    # export_cleaned_data also writes data_cleaning_summary.txt to the working directory
+    monkeypatch.chdir(tmp_path)
+    store = DedupStore(str(tmp_path / 'dedup.db'))
+    empty = pd.DataFrame({'Data Type': pd.Series([], dtype=object), 'Content': pd.Series([], dtype=object)})
+    df = make_rows(3)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert list(remove_duplicates(empty, dedup_store=store).columns) == ['Data Type', 'Content']
+
+        first = clean_dataframe(df, dedup_store=store)
+        export_cleaned_data(first, str(tmp_path / 'cleaned.csv'), dedup_store=store)
+
+        # Every row was exported already - zero rows, but the columns survive the later steps
+        second = clean_dataframe(df, dedup_store=store)
+
+    assert len(first) == 3
+    assert len(second) == 0
+    assert {'Data Type', 'Content'} <= set(second.columns)
+    store.close()
@@ -0,0 +1,33 @@
+import pytest
+
+from dedup_store import DedupStore, content_fingerprint
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DedupStore(str(tmp_path / 'dedup.db'))
+    yield store
+    store.close()
+
+
+def test_unseen_records_nothing(store):
+    pairs = [('a', 'u'), ('b', 'u'), ('a', 'u')]
+    assert store.unseen_content(pairs) == [True, True, False]
+    # Nothing was recorded, so the same check gives the same answer
+    assert store.unseen_content(pairs) == [True, True, False]
+    assert store.count() == 0
+
+    store.record_content(pairs[:1])
+    assert store.unseen_content(pairs) == [False, True, False]
+    assert store.count() == 1
+
+
+def test_namespaces_are_independent(store):
+    store.add('text', 'u', namespace='scraped')
+    assert store.seen('text', 'u', namespace='scraped')
+    assert not store.seen('text', 'u', namespace='cleaned')
+
+
+def test_fingerprint_is_case_sensitive_like_drop_duplicates():
+    assert content_fingerprint('Hello  world ') == content_fingerprint('Hello world')
+    assert content_fingerprint('Hello world') != content_fingerprint('hello world')
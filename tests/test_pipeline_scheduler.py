@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip('schedule')
+from real_production_pipeline import PipelineScheduler
+
+
+class FakePipeline:
+    selenium_pool_size = 4
+
+    def __init__(self):
+        self.pool_sizes = []
+        self.closed = False
+
+    def start_selenium_pool(self, size=None):
+        self.pool_sizes.append(size)
+
+    def close(self):
+        self.closed = True
+
+
+def make_scheduler(sources, pipeline=None):
+    scheduler = PipelineScheduler(pipeline or FakePipeline(), sources=sources)
+    scheduler.submit = lambda source: None
+    return scheduler
+
+
+def interval_seconds(scheduler, name):
+    job = next(job for job in scheduler.scheduler.jobs if name in job.tags)
+    return job.interval, job.latest, job.unit
+
+
+def test_fractional_and_ranged_intervals_are_scheduled_in_seconds():
+    scheduler = make_scheduler([
+        {'name': 'fixed', 'kind': 'static', 'url': 'https://a.example/', 'every_minutes': 30},
+        {'name': 'range', 'kind': 'static', 'url': 'https://b.example/', 'every_minutes': (55, 65)},
+        {'name': 'fractional', 'kind': 'static', 'url': 'https://c.example/', 'every_minutes': (0.5, 1.5)}
+    ])
+
+    assert interval_seconds(scheduler, 'fixed') == (1800, None, 'seconds')
+    assert interval_seconds(scheduler, 'range') == (3300, 3900, 'seconds')
+    assert interval_seconds(scheduler, 'fractional') == (30, 90, 'seconds')
+    # Jittered jobs can compute their next run (randrange needs integer bounds)
+    assert all(job.next_run is not None for job in scheduler.scheduler.jobs)
+    scheduler.shutdown()
+
+
+def test_driver_pool_is_sized_by_selenium_sources():
+    pipeline = FakePipeline()
+    scheduler = make_scheduler([
+        {'name': 'one', 'kind': 'selenium', 'site': {}, 'every_minutes': 60},
+        {'name': 'two', 'kind': 'selenium', 'site': {}, 'every_minutes': 60},
+        {'name': 'static', 'kind': 'static', 'url': 'https://a.example/', 'every_minutes': 60}
+    ], pipeline)
+    scheduler.stop()
+
+    scheduler.run_forever(run_immediately=False)
+
+    assert pipeline.pool_sizes == [2]
+    assert pipeline.closed
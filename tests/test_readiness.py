@@ -0,0 +1,36 @@
+from readiness import PageReadiness, MARK_PAGE_JS, PAGE_CHANGED_JS
+
+
+class FakeDriver:
+    """Reports a page change after a given number of PAGE_CHANGED_JS polls"""
+
+    def __init__(self, change_after):
+        self.change_after = change_after
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if script == PAGE_CHANGED_JS:
+            return self.scripts.count(PAGE_CHANGED_JS) > self.change_after
+        return None
+
+
+def test_page_change_returns_as_soon_as_the_page_changes():
+    driver = FakeDriver(change_after=2)
+    readiness = PageReadiness(driver, poll_interval=0.01)
+
+    readiness.mark_page()
+    result = readiness.wait_for_page_change(timeout=5)
+
+    assert driver.scripts[0] == MARK_PAGE_JS
+    assert result['ready']
+    assert result['elapsed'] < 1
+
+
+def test_page_change_times_out_without_raising():
+    readiness = PageReadiness(FakeDriver(change_after=10 ** 6), poll_interval=0.01)
+
+    result = readiness.wait_for_page_change(timeout=0.05)
+
+    assert not result['ready']
+    assert result['signal'] == 'page_change'
@@ -0,0 +1,71 @@
+import sqlite3
+
+import pytest
+
+from record_writer import RecordWriter, as_text, as_int
+
+QUOTE_FIELDS = [
+    ('quote_text', ('quote_text', 'text'), as_text, ''),
+    ('author', 'author', as_text, 'Unknown'),
+    ('page_number', ('page_number', 'page'), as_int, 1)
+]
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:')
+    conn.execute('''
+        CREATE TABLE quotes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            quote_text TEXT,
+            author TEXT,
+            page_number INTEGER,
+            scrape_timestamp DATETIME DEFAULT '2000-01-01 00:00:00',
+            UNIQUE (quote_text, author)
+        )
+    ''')
+    yield conn
+    conn.close()
+
+
+def rows(conn):
+    return conn.execute('SELECT id, quote_text, author, page_number FROM quotes ORDER BY id').fetchall()
+
+
+def test_to_row_uses_key_fallbacks_casts_and_defaults():
+    writer = RecordWriter('quotes', QUOTE_FIELDS)
+
+    assert writer.to_row({'text': 'Q', 'author': 'A', 'page': '3'}) == ('Q', 'A', 3)
+    assert writer.to_row({'quote_text': 'Q', 'text': 'ignored', 'page': 'n/a'}) == ('Q', 'Unknown', None)
+    assert writer.to_row({}) == ('', 'Unknown', 1)
+
+
+def test_plain_insert_appends():
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE quotes (quote_text TEXT, author TEXT, page_number INTEGER)')
+    writer = RecordWriter('quotes', QUOTE_FIELDS)
+
+    assert 'ON CONFLICT' not in writer.sql
+    assert writer.write(conn, iter([{'text': 'Q', 'author': 'A'}] * 2)) == 2
+    assert conn.execute('SELECT COUNT(*) FROM quotes').fetchone()[0] == 2
+    conn.close()
+
+
+def test_upsert_refreshes_instead_of_duplicating(conn):
+    writer = RecordWriter('quotes', QUOTE_FIELDS, conflict_columns=('quote_text', 'author'))
+
+    assert writer.write(conn, [{'text': 'Q1', 'author': 'A', 'page': 1}, {'text': 'Q2', 'author': 'A'}]) == 2
+    assert writer.write(conn, (record for record in [{'text': 'Q1', 'author': 'A', 'page': 5}])) == 1
+
+    # Same id, refreshed non-key column and timestamp; no new row
+    assert rows(conn) == [(1, 'Q1', 'A', 5), (2, 'Q2', 'A', 1)]
+    timestamps = dict(conn.execute('SELECT quote_text, scrape_timestamp FROM quotes'))
+    assert timestamps['Q1'] > '2000-01-01 00:00:00'
+    assert timestamps['Q2'] == '2000-01-01 00:00:00'
+
+
+def test_same_text_different_author_is_a_new_row(conn):
+    writer = RecordWriter('quotes', QUOTE_FIELDS, conflict_columns=('quote_text', 'author'))
+
+    writer.write(conn, [{'text': 'Q', 'author': 'A'}, {'text': 'Q', 'author': 'B'}])
+    assert [row[1:3] for row in rows(conn)] == [('Q', 'A'), ('Q', 'B')]
@@ -0,0 +1,81 @@
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+from page_archive import PageArchive
+from page_parsers import parse_page_content
+from replay import ReplaySource, ReplayServer
+
+URL = 'https://quotes.toscrape.com/scroll'
+
+# A fully scrolled DOM as the browser holds it after incremental extraction:
+# every element carries the marker left by NEW_CONTENT_JS
+MARKED_PAGE = '''<!DOCTYPE html><html><head><title>Quotes</title></head><body>
+<h1 data-scraped="1">Quotes to Scrape</h1>
+<p data-scraped="1">The world as we have created it is a process of our thinking.</p>
+<p data-scraped="1">It is our choices that show what we truly are.</p>
+<ul><li data-scraped="1">Albert Einstein</li></ul>
+</body></html>'''
+
+# What archive_page_source() stores for it
+CLEAN_PAGE = MARKED_PAGE.replace(' data-scraped="1"', '')
+
+
+def unmarked_elements(html):
+    """What NEW_CONTENT_JS would still extract from a freshly loaded copy of html"""
+    soup = BeautifulSoup(html, 'html.parser')
+    return [node for node in soup.select('p, h1, h2, h3, h4, h5, h6, li') if not node.has_attr('data-scraped')]
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = PageArchive(str(tmp_path / 'archive'), codec='gzip')
+    archive.store(URL, CLEAN_PAGE, source='selenium')
+    yield archive
+    archive.close()
+
+
+def test_replayed_snapshot_is_a_fresh_page(archive):
+    response = ReplaySource(archive=archive).response(URL)
+
+    assert response.status_code == 200
+    assert len(unmarked_elements(response.text)) == 4
+
+
+def test_replay_returns_bodies_unchanged(tmp_path):
+    # An HTTP page may legitimately use the same attribute - replay must not touch it
+    archive = PageArchive(str(tmp_path / 'archive'), codec='gzip')
+    archive.store(URL, MARKED_PAGE, source='http')
+
+    assert ReplaySource(archive=archive).response(URL).text == MARKED_PAGE
+    archive.close()
+
+
+def test_replay_server_round_trip_extracts_content(archive):
+    with ReplayServer(ReplaySource(archive=archive)) as server:
+        html = requests.get(server.url_for(URL), timeout=5).text
+
+    assert unmarked_elements(html)
+    content = parse_page_content(html)
+    assert [item['type'] for item in content] == ['paragraph', 'paragraph', 'heading', 'list_item']
+
+
+def test_archive_page_source_strips_markers(tmp_path):
+    pytest.importorskip('selenium')
+    from selenium_practice import DynamicContentScraper, CLEAN_PAGE_SOURCE_JS
+
+    class FakeDriver:
+        page_source = MARKED_PAGE
+
+        def execute_script(self, script, *args):
+            assert script == CLEAN_PAGE_SOURCE_JS
+            return CLEAN_PAGE
+
+    archive = PageArchive(str(tmp_path / 'archive'), codec='gzip')
+    scraper = DynamicContentScraper.__new__(DynamicContentScraper)
+    scraper.driver = FakeDriver()
+    scraper.archive = archive
+
+    digest = scraper.archive_page_source(URL)
+    assert b'data-scraped' not in archive.load(digest)
+    archive.close()
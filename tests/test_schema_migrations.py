@@ -0,0 +1,87 @@
+import sqlite3
+
+import pytest
+
+from connection_manager import ConnectionManager
+from schema_migrations import apply_migrations, get_schema_version, add_column_if_missing, add_unique_key, column_exists
+
+
+def create_items(cursor):
+    cursor.execute('CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT)')
+
+
+def add_price(cursor):
+    add_column_if_missing(cursor, 'items', 'price', 'REAL')
+
+
+def add_name_key(cursor):
+    add_unique_key(cursor, 'ux_items_name', 'items', ('name',))
+
+
+MIGRATIONS = [
+    (1, 'create items', create_items),
+    (2, 'add price', add_price),
+    (3, 'unique name', add_name_key)
+]
+
+
+@pytest.fixture
+def cursor():
+    conn = sqlite3.connect(':memory:')
+    yield conn.cursor()
+    conn.close()
+
+
+def log_rows(cursor):
+    return cursor.execute('SELECT component, version FROM schema_migration_log ORDER BY id').fetchall()
+
+
+def test_migrations_apply_once(cursor):
+    assert apply_migrations(cursor, 'items', MIGRATIONS) == [1, 2, 3]
+    assert apply_migrations(cursor, 'items', MIGRATIONS) == []
+    assert get_schema_version(cursor, 'items') == 3
+    assert log_rows(cursor) == [('items', 1), ('items', 2), ('items', 3)]
+
+
+def test_only_newer_migrations_run(cursor):
+    assert apply_migrations(cursor, 'items', MIGRATIONS[:1]) == [1]
+    assert apply_migrations(cursor, 'items', MIGRATIONS) == [2, 3]
+    assert get_schema_version(cursor, 'items') == 3
+
+
+def test_components_are_versioned_separately(cursor):
+    apply_migrations(cursor, 'items', MIGRATIONS)
+    assert get_schema_version(cursor, 'other') == 0
+    assert apply_migrations(cursor, 'other', [(1, 'noop', lambda cursor: None)]) == [1]
+    assert get_schema_version(cursor, 'items') == 3
+
+
+def test_legacy_table_keeps_rows_and_loses_duplicates(cursor):
+    # A database created before versioning: no schema_version, duplicate rows
+    cursor.execute('CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT)')
+    cursor.executemany('INSERT INTO items (name) VALUES (?)', [('a',), ('b',), ('a',)])
+
+    assert apply_migrations(cursor, 'items', MIGRATIONS) == [1, 2, 3]
+    assert cursor.execute('SELECT id, name, price FROM items ORDER BY id').fetchall() == [(2, 'b', None), (3, 'a', None)]
+
+
+def test_failed_step_leaves_previous_version(tmp_path):
+    def broken(cursor):
+        cursor.execute('ALTER TABLE missing ADD COLUMN x TEXT')
+
+    manager = ConnectionManager(str(tmp_path / 'test.db'))
+    with manager.write() as conn:
+        apply_migrations(conn.cursor(), 'items', MIGRATIONS[:1])
+
+    with pytest.raises(sqlite3.OperationalError):
+        with manager.write() as conn:
+            apply_migrations(conn.cursor(), 'items', MIGRATIONS[1:2] + [(3, 'broken', broken)])
+
+    # Step 2 ran before the failure but was rolled back with it
+    cursor = manager.connection().cursor()
+    assert get_schema_version(cursor, 'items') == 1
+    assert not column_exists(cursor, 'items', 'price')
+
+    with manager.write() as conn:
+        assert apply_migrations(conn.cursor(), 'items', MIGRATIONS) == [2, 3]
+    manager.close()
@@ -0,0 +1,91 @@
+import sqlite3
+import threading
+
+import pytest
+
+from database_scraper_fixed import ScrapingDatabase
+from dedup_store import DedupStore
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    # ScrapingDatabase writes scraping_database.log to the working directory
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path / 'scraping.db')
+
+
+def test_close_leaves_other_users_of_the_manager_open(db_path):
+    db = ScrapingDatabase(db_name=db_path)
+    results = {}
+    connected = threading.Event()
+    db_closed = threading.Event()
+
+    def other_thread():
+        other = ScrapingDatabase(db_name=db_path)
+        # Held the way the pipeline holds self.conn
+        conn = other.connections.connection()
+        connected.set()
+        db_closed.wait(5)
+        try:
+            results['count'] = conn.execute('SELECT COUNT(*) FROM quotes').fetchone()[0]
+        except Exception as e:
+            results['error'] = e
+        other.close()
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    connected.wait(5)
+    db.close()
+    db_closed.set()
+    thread.join()
+
+    assert results == {'count': 0}
+
+
+def test_failed_insert_does_not_blacklist_content(db_path, tmp_path):
+    store = DedupStore(str(tmp_path / 'dedup.db'))
+    db = ScrapingDatabase(db_name=db_path, dedup_store=store)
+    records = [{'type': 'paragraph', 'content': 'some text', 'source_url': 'https://example.com'}]
+
+    def failing_bulk_insert(sql, rows):
+        raise sqlite3.OperationalError('database is locked')
+
+    db.bulk_insert = failing_bulk_insert
+    assert db.save_general_content(records) == 0
+    assert store.count('general_content') == 0
+
+    # The retry goes through and only then is the content recorded
+    del db.bulk_insert
+    assert db.save_general_content(records) == 1
+    assert store.count('general_content') == 1
+    assert db.save_general_content(records) == 0
+
+    db.close()
+    store.close()
+
+
+def test_upserted_tables_are_refreshed_even_with_a_dedup_store(db_path, tmp_path):
+    store = DedupStore(str(tmp_path / 'dedup.db'))
+    db = ScrapingDatabase(db_name=db_path, dedup_store=store)
+    product = {'name': 'Laptop', 'price': '$100', 'source_url': 'https://example.com'}
+
+    assert db.save_products([product]) == 1
+    assert db.save_products([dict(product, price='$90')]) == 1
+
+    rows = db.connections.connection().execute('SELECT price FROM products').fetchall()
+    assert rows == [('$90',)]
+
+    db.close()
+    store.close()
+
+
+def test_reopening_does_not_rerun_migrations(db_path):
+    ScrapingDatabase(db_name=db_path).close()
+    db = ScrapingDatabase(db_name=db_path)
+
+    conn = db.connections.connection()
+    versions = conn.execute(
+        "SELECT version FROM schema_migration_log WHERE component = 'scraping_database' ORDER BY id"
+    ).fetchall()
+    assert versions == [(version,) for version, _, _ in db.migrations()]
+    db.close()
@@ -0,0 +1,53 @@
+import threading
+
+from connection_manager import ConnectionManager
+from streaming_writer import StreamingWriter
+
+
+def test_batches_are_written_and_flushed():
+    batches = []
+    writer = StreamingWriter(lambda table, records: batches.append((table, list(records))), batch_size=3)
+
+    with writer:
+        writer.emit_many('quotes', range(7))
+        assert writer.flush(timeout=5)
+        assert sum(len(records) for _, records in batches) == 7
+
+    assert [len(records) for _, records in batches] == [3, 3, 1]
+    assert writer.written == {'quotes': 7}
+
+
+def test_failed_batch_is_counted_and_writer_keeps_going():
+    def write_batch(table, records):
+        if table == 'broken':
+            raise ValueError('bad batch')
+
+    with StreamingWriter(write_batch, batch_size=2) as writer:
+        writer.emit_many('broken', [1, 2])
+        writer.emit_many('quotes', [1, 2])
+
+    assert writer.failed == {'broken': 2}
+    assert writer.written == {'quotes': 2}
+
+
+def test_writer_thread_releases_its_connection(tmp_path):
+    manager = ConnectionManager(str(tmp_path / 'test.db'))
+    with manager.write() as conn:
+        conn.execute('CREATE TABLE items (value INTEGER)')
+    main_conn = manager.connection()
+    writer_threads = set()
+
+    def write_batch(table, records):
+        writer_threads.add(threading.current_thread())
+        with manager.write() as conn:
+            conn.executemany('INSERT INTO items VALUES (?)', [(record,) for record in records])
+
+    # Several runs in a row, like the scheduler does
+    for _ in range(3):
+        with StreamingWriter(write_batch, on_exit=manager.release) as writer:
+            writer.emit_many('items', range(10))
+
+    assert len(writer_threads) == 3
+    assert manager._connections == [main_conn]
+    assert main_conn.execute('SELECT COUNT(*) FROM items').fetchone()[0] == 30
+    manager.close()
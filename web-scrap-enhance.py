@@ -1,61 +1,45 @@
 import requests
-from bs4 import BeautifulSoup
 import csv
 import time
+import sys
 
-def enhanced_scraper():
+# Shared fetch engine lives in the Dynamic_Scraping folder
+sys.path.append('Dynamic_Scraping')
+from fetch_engine import get_fetch_engine
+from static_extractor import extract_static_content
+from http_cache import get_http_cache
+
+def enhanced_scraper(use_cache=True, replay=None):
     """
     Enhanced web scraper with better error handling and data processing
+    With use_cache, the page is revalidated against the on-disk HTTP cache
+    and an unchanged page (304) is not parsed again - returns {} in that case
+    replay: optional ReplaySource - serve the captured page instead of fetching it
     """
     # Target URL
     url = "https://www.passiton.com/inspirational-quotes/"
     
-    # Headers to mimic a real browser request
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
     try:
         print("Starting web scraping...")
         
-        # Make the request with headers
-        response = requests.get(url, headers=headers)
+        # Make the request through the shared engine (browser headers, timeouts, keep-alive)
+        response = get_fetch_engine().get(url, cache=get_http_cache() if use_cache and not replay else None,
+                                          replay=replay)
         response.raise_for_status()
         
-        print("Successfully connected to the website")
+        if response.not_modified:
+            print("Page not modified since last run - skipping parsing")
+            return {}
         
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'lxml')  # Using lxml parser for better performance
+        print("Successfully connected to the website")
         
-        # Let's try to extract different types of data
-        scraped_data = {}
+        # Parse HTML and extract title, links and paragraphs
+        scraped_data = extract_static_content(response.content, max_links=15, max_paragraphs=5,
+                                              parser='lxml')  # Using lxml parser for better performance
         
-        # Extract page title
-        page_title = soup.find('title')
-        if page_title:
-            scraped_data['page_title'] = page_title.get_text().strip()
+        if 'page_title' in scraped_data:
             print(f"Page Title: {scraped_data['page_title']}")
         
-        # Extract all links
-        links = soup.find_all('a', href=True)
-        scraped_data['links'] = []
-        
-        for link in links[:15]:  # Get first 15 links
-            link_data = {
-                'text': link.get_text().strip()[:50],  # Limit text length
-                'url': link['href']
-            }
-            scraped_data['links'].append(link_data)
-        
-        # Extract paragraphs
-        paragraphs = soup.find_all('p')
-        scraped_data['paragraphs'] = []
-        
-        for para in paragraphs[:5]:  # Get first 5 paragraphs
-            text = para.get_text().strip()
-            if text and len(text) > 10:  # Only meaningful paragraphs
-                scraped_data['paragraphs'].append(text[:200])  # Limit length
-        
         # Display results
         print("\n Scraping Results:")
         print(f"• Found {len(scraped_data['links'])} links")
@@ -107,6 +91,23 @@ def save_to_csv(data, filename='scraped_data.csv'):
     except Exception as e:
         print(f"Error saving to CSV: {e}")
 
+def crawl_many(urls, max_concurrency=64, per_host_limit=8, replay=None):
+    """
+    Run the same extraction as enhanced_scraper() over many URLs concurrently
+    Returns {url: scraped_data} for every page that was fetched successfully
+    """
+    from async_crawler import AsyncCrawler
+    
+    with AsyncCrawler(
+        max_concurrency=max_concurrency,
+        per_host_limit=per_host_limit,
+        extract=lambda html: extract_static_content(html, max_links=15, max_paragraphs=5, parser='lxml'),
+        replay=replay
+    ) as crawler:
+        results = crawler.run(urls)
+    
+    return {result['url']: result['data'] for result in results if not result['error']}
+
 if __name__ == "__main__":
     # Add a small delay to be respectful to the server
     time.sleep(2)
@@ -1,14 +1,21 @@
 import requests
 from bs4 import BeautifulSoup
 import csv
+import sys
 
-def scrape_website():
+# Shared fetch engine lives in the Dynamic_Scraping folder
+sys.path.append('Dynamic_Scraping')
+from fetch_engine import get_fetch_engine
+
+def scrape_website(replay=None):
+    # replay: optional ReplaySource - use a captured copy of the page instead of the live site
+    
     # Step 1: Send HTTP request to the website
     url = "https://www.geeksforgeeks.org/python-programming-language/"
     
     try:
-        # Send GET request to the website
-        response = requests.get(url)
+        # Send GET request through the shared pooled session
+        response = get_fetch_engine().get(url, replay=replay)
         
         # Check if request was successful
         response.raise_for_status()  # This will raise an exception for bad status codes